@@ -1,5 +1,5 @@
 import streamlit as st
-from core.theme import setup_theme, setup_page_config
+from core.theme import setup_theme_base, setup_theme_dashboard, setup_page_config
 from teams_config import TEAMS_CONFIG
 from pages.landing import render_landing_page
 from pages.match_report import render_match_report
@@ -13,7 +13,7 @@ def main():
     """Main application entry point"""
     # Setup page configuration and theme
     setup_page_config()
-    setup_theme()
+    setup_theme_base()
     
     # Initialize session state
     if 'selected_team' not in st.session_state:
@@ -31,6 +31,9 @@ def main():
             st.rerun()
             return
         
+        # Dashboard-only styles are skipped on the landing page
+        setup_theme_dashboard()
+        
         # Setup sidebar and get selections
         report_type, api_key = setup_sidebar(team_config)
         
@@ -1,22 +1,56 @@
 """AI Assistant Coach functionality"""
+import time
 import streamlit as st
-from typing import Optional
+from typing import Callable, Iterator, Optional, Union
 
-def get_ai_coach_insights(context: str, data_summary: str, api_key: str) -> str:
-    """Get AI coach insights based on current context and data"""
+# Resolve the optional OpenAI dependency once at import time
+try:
+    from openai import OpenAI
+    _OPENAI_OK = True
+except ImportError:
+    _OPENAI_OK = False
+
+# Throttle for streamed output: rerender at most every interval or N tokens
+STREAM_RENDER_INTERVAL = 0.2  # seconds
+STREAM_RENDER_MAX_PENDING = 16  # tokens
+
+@st.cache_resource(show_spinner=False)
+def _get_openai_client(api_key: str):
+    """Create an OpenAI client once per API key and reuse its connection pool"""
+    return OpenAI(api_key=api_key)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _pick_model(api_key: str) -> str:
+    """Pick GPT-4 when the account has access to it, otherwise GPT-3.5-turbo"""
+    available = {model.id for model in _get_openai_client(api_key).models.list()}
+    return "gpt-4" if "gpt-4" in available else "gpt-3.5-turbo"
+
+def _create_completion_stream(client, model: str, prompt: str):
+    """Open a streaming chat completion for the given model"""
+    return client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": "You are an expert soccer performance analyst and coach."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.7,
+        max_tokens=500,
+        stream=True
+    )
+
+def get_ai_coach_insights(context: str, data_summary: str, api_key: str) -> Iterator[str]:
+    """Stream AI coach insights based on current context and data"""
     if not api_key:
-        return "Please enter your OpenAI API key in the sidebar to enable AI Coach insights."
+        yield "Please enter your OpenAI API key in the sidebar to enable AI Coach insights."
+        return
     
-    try:
-        import openai
-    except ImportError:
-        return "OpenAI library not installed. Please run: pip install openai"
+    if not _OPENAI_OK:
+        yield "OpenAI library not installed. Please run: pip install openai"
+        return
     
     try:
-        from openai import OpenAI
-        
-        # Initialize client with API key
-        client = OpenAI(api_key=api_key)
+        # Reuse the cached client for this API key
+        client = _get_openai_client(api_key)
         
         prompt = f"""
         You are an expert soccer coach analyzing performance data for SSA Swarm USL2 team.
@@ -35,51 +69,53 @@ def get_ai_coach_insights(context: str, data_summary: str, api_key: str) -> str:
         Keep your response concise and actionable, focusing on practical coaching insights.
         """
         
-        # Try GPT-4 first, fall back to GPT-3.5-turbo if not available
+        # Use GPT-4 when available; the model list is probed once per key, not per click
         try:
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert soccer performance analyst and coach."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            return response.choices[0].message.content
+            response = _create_completion_stream(client, _pick_model(api_key), prompt)
         except Exception as e:
-            # If GPT-4 fails, try GPT-3.5-turbo
-            if "model" in str(e).lower() or "404" in str(e):
-                try:
-                    response = client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[
-                            {"role": "system", "content": "You are an expert soccer performance analyst and coach."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.7,
-                        max_tokens=500
-                    )
-                    return response.choices[0].message.content
-                except Exception as fallback_error:
-                    return f"AI Coach unavailable: {str(fallback_error)}. Please check your API key."
-            else:
-                return f"AI Coach unavailable: {str(e)}. Please check your API key."
+            yield f"AI Coach unavailable: {str(e)}. Please check your API key."
+            return
+        
+        for chunk in response:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
     
     except Exception as e:
-        return f"AI Coach unavailable: {str(e)}. Please ensure you have the latest OpenAI library installed."
+        yield f"AI Coach unavailable: {str(e)}. Please ensure you have the latest OpenAI library installed."
+
+@st.fragment
+def display_ai_assistant(context: str, data_summary: Union[str, Callable[[], str]], api_key: str):
+    """Display AI assistant coach insights; runs as a fragment so a click only reruns this block.
 
-def display_ai_assistant(context: str, data_summary: str, api_key: str):
-    """Display AI assistant coach insights"""
+    data_summary may be a zero-argument callable, which is only invoked when insights are requested.
+    """
     with st.expander("🤖 AI Assistant Coach", expanded=False):
         # Create a unique key based on context
         button_key = f"ai_button_{context.replace(' ', '_').replace('/', '_').replace(':', '_')}"
         
         if st.button("Get AI Insights", key=button_key):
+            placeholder = st.empty()
+            insights = ""
+            pending = 0
+            last_render = time.monotonic()
             with st.spinner("Analyzing data..."):
-                insights = get_ai_coach_insights(context, data_summary, api_key)
-                # Store insights in session state
-                st.session_state[f"insights_{button_key}"] = insights
+                if callable(data_summary):
+                    data_summary = data_summary()
+                for token in get_ai_coach_insights(context, data_summary, api_key):
+                    insights += token
+                    pending += 1
+                    # Coalesce tokens so the placeholder is not redrawn per delta
+                    now = time.monotonic()
+                    if now - last_render >= STREAM_RENDER_INTERVAL or pending >= STREAM_RENDER_MAX_PENDING:
+                        placeholder.markdown(insights)
+                        last_render = now
+                        pending = 0
+                placeholder.markdown(insights)
+            # Store insights in session state; rendered once below
+            st.session_state[f"insights_{button_key}"] = insights
+            placeholder.empty()
         
         # Display insights if they exist in session state
         if f"insights_{button_key}" in st.session_state:
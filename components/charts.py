@@ -1,12 +1,17 @@
 """Chart creation functions"""
+import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
+from plotly.subplots import make_subplots
 import pandas as pd
-import numpy as np
 from typing import List, Optional
 from core.theme import ThemeConfig
-from core.constants import METRICS
+from components.metrics import top_k_indices
 
+# Figures depend only on their inputs, so rebuilds on rerun are served from cache
+_cache_figure = st.cache_data(show_spinner=False)
+
+@_cache_figure
 def create_plotly_radar(data: List[List[float]], categories: List[str], 
                        title: str, names: Optional[List[str]] = None) -> go.Figure:
     """Create an enhanced Plotly radar chart"""
@@ -54,11 +59,14 @@ def create_plotly_radar(data: List[List[float]], categories: List[str],
     
     return fig
 
+@_cache_figure
 def create_performance_bar_chart(data: pd.DataFrame, metric: str, 
-                                title: str, show_average: bool = True) -> go.Figure:
-    """Create a standardized performance bar chart"""
-    chart_data = data.groupby("Player Name")[metric].mean().reset_index()
-    chart_data = chart_data.sort_values(by=metric, ascending=False)
+                                title: str, show_average: bool = True,
+                                top_n: Optional[int] = None) -> go.Figure:
+    """Create a standardized performance bar chart, optionally limited to the top_n players"""
+    player_means = data.groupby("Player Name", observed=True, sort=False)[metric].mean()
+    ranked = top_k_indices(player_means.to_numpy(), top_n or len(player_means))
+    chart_data = player_means.iloc[ranked].reset_index()
     
     fig = px.bar(
         chart_data,
@@ -78,8 +86,8 @@ def create_performance_bar_chart(data: pd.DataFrame, metric: str,
         showlegend=False
     )
     
-    if show_average and not chart_data.empty:
-        avg_value = chart_data[metric].mean()
+    if show_average and not player_means.empty:
+        avg_value = player_means.mean()
         fig.add_hline(
             y=avg_value,
             line_dash="dash",
@@ -90,27 +98,70 @@ def create_performance_bar_chart(data: pd.DataFrame, metric: str,
     
     return fig
 
+@_cache_figure
+def create_faceted_performance_bar_chart(data: pd.DataFrame, metrics: List[str],
+                                         title: str, show_average: bool = True) -> go.Figure:
+    """Create one figure with a player bar chart per metric, stacked in rows"""
+    player_means = data.groupby("Player Name", observed=True, sort=False)[metrics].mean()
+    
+    fig = make_subplots(
+        rows=len(metrics), cols=1,
+        subplot_titles=[f"{metric} by Player" for metric in metrics],
+        vertical_spacing=min(0.08, 1 / max(len(metrics) - 1, 1))
+    )
+    
+    for row, metric in enumerate(metrics, start=1):
+        values = player_means[metric].sort_values(ascending=False)
+        fig.add_trace(go.Bar(
+            x=values.index.astype(str),
+            y=values.values,
+            marker=dict(color=values.values,
+                        colorscale=[[0, "#1A1A1D"], [1, ThemeConfig.PRIMARY_COLOR]]),
+            name=metric,
+            hovertemplate="%{x}<br>" + metric + ": %{y:.2f}<extra></extra>"
+        ), row=row, col=1)
+        
+        if show_average and not values.empty:
+            avg_value = values.mean()
+            fig.add_hline(
+                y=avg_value,
+                line_dash="dash",
+                line_color=ThemeConfig.SECONDARY_COLOR,
+                annotation_text=f"Team Avg: {avg_value:.1f}",
+                annotation_position="top right",
+                row=row, col=1
+            )
+    
+    fig.update_xaxes(tickangle=-45)
+    fig.update_layout(
+        title=title,
+        plot_bgcolor=ThemeConfig.CARD_BACKGROUND,
+        paper_bgcolor=ThemeConfig.BACKGROUND_COLOR,
+        font=dict(color=ThemeConfig.TEXT_COLOR),
+        height=400 * len(metrics),
+        showlegend=False
+    )
+    
+    return fig
+
+@_cache_figure
 def create_trend_line_chart(data: pd.DataFrame, metric: str, 
                            group_by: str, time_column: str,
                            title: str) -> go.Figure:
     """Create a trend line chart with optional trend lines"""
-    fig = go.Figure()
-    
     # Group data
-    grouped_data = data.groupby([time_column, group_by])[metric].mean().reset_index()
+    grouped_data = data.groupby([time_column, group_by], observed=True)[metric].mean().reset_index()
     
-    # Add lines for each group
-    for group in grouped_data[group_by].unique():
-        group_data = grouped_data[grouped_data[group_by] == group]
-        
-        fig.add_trace(go.Scatter(
-            x=group_data[time_column],
-            y=group_data[metric],
-            mode='lines+markers',
-            name=group,
-            line=dict(width=3),
-            marker=dict(size=8)
-        ))
+    # One line per group, built in a single Plotly Express call and drawn with WebGL (scattergl)
+    fig = px.line(
+        grouped_data,
+        x=time_column,
+        y=metric,
+        color=group_by,
+        markers=True,
+        render_mode="webgl"
+    )
+    fig.update_traces(line=dict(width=3), marker=dict(size=8))
     
     fig.update_layout(
         title=title,
@@ -120,18 +171,45 @@ def create_trend_line_chart(data: pd.DataFrame, metric: str,
         paper_bgcolor=ThemeConfig.BACKGROUND_COLOR,
         font=dict(color=ThemeConfig.TEXT_COLOR),
         height=500,
-        hovermode='x unified'
+        hovermode='x unified',
+        legend_title_text=None
     )
     
     return fig
 
+@_cache_figure
 def create_heatmap(data: pd.DataFrame, title: str) -> go.Figure:
     """Create a heatmap visualization"""
+    # Raw array plus labels, so Plotly doesn't re-inspect the DataFrame
+    fig = go.Figure(go.Heatmap(
+        z=data.to_numpy(),
+        x=data.columns.astype(str).tolist(),
+        y=data.index.astype(str).tolist(),
+        colorscale=[[0, "#1A1A1D"], [1, ThemeConfig.PRIMARY_COLOR]]
+    ))
+    
+    fig.update_layout(
+        title=title,
+        height=600,
+        yaxis=dict(autorange="reversed"),
+        plot_bgcolor=ThemeConfig.CARD_BACKGROUND,
+        paper_bgcolor=ThemeConfig.BACKGROUND_COLOR,
+        font=dict(color=ThemeConfig.TEXT_COLOR)
+    )
+    
+    return fig
+
+@_cache_figure
+def create_normalized_heatmap(normalized: pd.DataFrame, players: tuple, metrics: tuple,
+                              title: str) -> go.Figure:
+    """Heatmap of pre-normalized player scores; the player/metric slice is part of the cache key"""
     fig = px.imshow(
-        data,
-        color_continuous_scale=["#1A1A1D", ThemeConfig.PRIMARY_COLOR],
+        normalized.loc[list(players), list(metrics)].T,
+        labels=dict(x="Player", y="Metric", color="Normalized Score"),
+        color_continuous_scale="RdYlGn",
+        aspect="auto",
         title=title,
-        height=600
+        height=400
     )
     
     fig.update_layout(
@@ -142,6 +220,7 @@ def create_heatmap(data: pd.DataFrame, title: str) -> go.Figure:
     
     return fig
 
+@_cache_figure
 def create_distribution_plot(data: pd.Series, metric: str, title: str) -> go.Figure:
     """Create a distribution plot with histogram and box plot"""
     fig = go.Figure()
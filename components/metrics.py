@@ -1,8 +1,11 @@
 """Metric cards and calculations"""
+import streamlit as st
 import pandas as pd
-from typing import Optional, Dict, List
+import numpy as np
+from typing import Optional, Dict, List, Tuple
 from core.theme import ThemeConfig
 from core.constants import METRICS, PERFORMANCE_WEIGHTS
+from utils.calculations import calculate_percentile_values  # noqa: F401
 
 def create_metric_card(label: str, value: str, delta: Optional[float] = None) -> str:
     """Create a custom metric card HTML"""
@@ -22,33 +25,66 @@ def create_metric_card(label: str, value: str, delta: Optional[float] = None) ->
     </div>
     """
 
-def calculate_performance_score(player_data: pd.Series, all_data: pd.DataFrame) -> float:
-    """Calculate weighted performance score for a player"""
-    score = 0
-    valid_metrics = 0
+def create_metric_card_row(cards: List[str]) -> str:
+    """Lay metric cards out in one flex row so they render as a single markdown element"""
+    # Drop indentation and blank lines so markdown keeps the whole row as one HTML block
+    lines = (line.strip() for card in cards for line in card.splitlines())
+    return '<div class="metric-card-row">\n' + "\n".join(line for line in lines if line) + "\n</div>"
+
+def calculate_performance_scores(player_averages: pd.DataFrame, all_data: pd.DataFrame) -> pd.Series:
+    """Calculate weighted performance scores for every row of player_averages in one pass"""
+    metrics = [m for m in PERFORMANCE_WEIGHTS if m in player_averages.columns and m in all_data.columns]
+    return score_against_team_means(player_averages, all_data[metrics].mean())
+
+def score_against_team_means(player_averages: pd.DataFrame, team_means: pd.Series) -> pd.Series:
+    """Weighted performance scores against precomputed team means (100 = team average)"""
+    team_means = team_means[team_means.index.isin(list(PERFORMANCE_WEIGHTS))
+                            & team_means.index.isin(player_averages.columns)]
+    team_means = team_means[team_means > 0]
     
-    for metric, weight in PERFORMANCE_WEIGHTS.items():
-        if metric in player_data.index and metric in all_data.columns:
-            player_value = player_data[metric]
-            avg_value = all_data[metric].mean()
-            if avg_value > 0:
-                score += (player_value / avg_value) * weight
-                valid_metrics += weight
+    if team_means.empty:
+        return pd.Series(0.0, index=player_averages.index)
     
-    return (score / valid_metrics * 100) if valid_metrics > 0 else 0
+    weights = pd.Series(PERFORMANCE_WEIGHTS)[team_means.index]
+    ratios = player_averages[team_means.index].astype(np.float64).div(team_means).mul(weights)
+    return ratios.sum(axis=1, skipna=False) / weights.sum() * 100
+
+def calculate_performance_score(player_data: pd.Series, all_data: pd.DataFrame) -> float:
+    """Calculate weighted performance score for a player"""
+    return float(calculate_performance_scores(player_data.to_frame().T, all_data).iloc[0])
+
+def rank_percentiles(sorted_values: np.ndarray, values: np.ndarray, total: Optional[int] = None) -> np.ndarray:
+    """Percent of sorted_values strictly below each value, out of total (default len(sorted_values)); NaN values rank 0"""
+    values = np.asarray(values, dtype=np.float64)
+    total = len(sorted_values) if total is None else total
+    if len(sorted_values) == 0 or total == 0:
+        return np.zeros(values.shape)
+    ranks = np.searchsorted(sorted_values, values, side='left')
+    return np.where(np.isnan(values), 0, ranks / total * 100)
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k highest scores, best first; NaN scores sort last"""
+    scores = np.asarray(scores, dtype=np.float64)
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    # Partial selection is O(n); only the k winners are fully sorted
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.lexsort((top, -scores[top]))]
 
-def calculate_percentile_values(selected_df: pd.DataFrame, full_df: pd.DataFrame, 
-                               metrics: List[str]) -> pd.DataFrame:
-    """Calculate percentile values for radar charts"""
-    percentile_df = selected_df.copy()
+def calculate_metric_stats(df: pd.DataFrame, metrics: Tuple[str, ...]) -> Dict[str, Dict]:
+    """Column summaries (min, max, mean, std, sorted values) for each metric"""
+    stats = {}
     for metric in metrics:
-        if metric in full_df.columns:
-            all_values = full_df[metric].dropna()
-            percentile_df[metric] = selected_df[metric].apply(
-                lambda val: (all_values < val).sum() / len(all_values) * 100 
-                if pd.notna(val) else 0
-            )
-    return percentile_df
+        if metric in df.columns:
+            values = df[metric].dropna().to_numpy(dtype=np.float64)
+            stats[metric] = {
+                "min": values.min() if len(values) else np.nan,
+                "max": values.max() if len(values) else np.nan,
+                "mean": values.mean() if len(values) else np.nan,
+                "std": values.std(ddof=1) if len(values) > 1 else np.nan,
+                "sorted": np.sort(values)
+            }
+    return stats
 
 def create_performance_summary(df: pd.DataFrame, player_name: Optional[str] = None) -> Dict[str, str]:
     """Create a performance summary with key insights"""
@@ -80,10 +116,8 @@ def calculate_load_score(df: pd.DataFrame) -> pd.Series:
         "Decelerations": 0.15
     }
     
-    load_score = pd.Series(0, index=df.index)
-    
-    for metric, weight in weights.items():
-        if metric in df.columns:
-            load_score += df[metric] * weight
+    cols = [metric for metric in weights if metric in df.columns]
+    weight_vector = np.fromiter((weights[metric] for metric in cols), dtype=np.float64, count=len(cols))
     
-    return load_score
+    # One matrix-vector product instead of a column-by-column accumulation
+    return pd.Series(df[cols].to_numpy(dtype=np.float64) @ weight_vector, index=df.index)
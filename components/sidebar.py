@@ -1,42 +1,51 @@
 """Sidebar configuration and navigation"""
+import io
+import os
 import streamlit as st
 from PIL import Image, ImageDraw
 from core.theme import ThemeConfig
 from typing import Tuple, Optional
 
-def create_circular_image(image_path: str) -> Optional[Image.Image]:
-    """Create a circular version of an image"""
+@st.cache_data(show_spinner=False)
+def _render_circular_image(image_path: str, mtime: float) -> bytes:
+    """Render the circular image as PNG bytes; mtime is part of the cache key so edits invalidate it"""
+    # Open and convert image
+    img = Image.open(image_path)
+    
+    # If JPEG, it might not have alpha channel
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+    
+    # Get the smaller dimension to make it square
+    size = min(img.size)
+    
+    # Create a mask
+    mask = Image.new('L', (size, size), 0)
+    draw = ImageDraw.Draw(mask)
+    draw.ellipse((0, 0, size, size), fill=255)
+    
+    # Crop image to square
+    left = (img.width - size) // 2
+    top = (img.height - size) // 2
+    img_cropped = img.crop((left, top, left + size, top + size))
+    
+    # Create output image with transparency
+    output = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    output.paste(img_cropped, (0, 0))
+    output.putalpha(mask)
+    
+    # Encode once so Streamlit does not re-encode the image on every rerun
+    buffer = io.BytesIO()
+    output.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+def create_circular_image(image_path: str) -> Optional[bytes]:
+    """Create a circular version of an image as PNG bytes"""
     try:
-        import os
         if not os.path.exists(image_path):
             return None
         
-        # Open and convert image
-        img = Image.open(image_path)
-        
-        # If JPEG, it might not have alpha channel
-        if img.mode != 'RGBA':
-            img = img.convert('RGBA')
-        
-        # Get the smaller dimension to make it square
-        size = min(img.size)
-        
-        # Create a mask
-        mask = Image.new('L', (size, size), 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse((0, 0, size, size), fill=255)
-        
-        # Crop image to square
-        left = (img.width - size) // 2
-        top = (img.height - size) // 2
-        img_cropped = img.crop((left, top, left + size, top + size))
-        
-        # Create output image with transparency
-        output = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        output.paste(img_cropped, (0, 0))
-        output.putalpha(mask)
-        
-        return output
+        return _render_circular_image(image_path, os.path.getmtime(image_path))
         
     except Exception as e:
         return None
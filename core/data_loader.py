@@ -1,29 +1,64 @@
 """Data loading and caching functions"""
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
+import threading
 import concurrent.futures
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from pandas.api.types import union_categoricals
 from typing import Dict, List, Optional
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# Rust-based xlsx reader is much faster than openpyxl; use it when installed
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+def _file_mtime(path: str) -> float:
+    """Modification time used in cache keys so edited files are re-read"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+def file_keys(file_dict: Dict[str, str]) -> tuple:
+    """(name, path, mtime) per file in configured order, for cache keys over several files"""
+    return tuple((name, path, _file_mtime(path)) for name, path in file_dict.items())
+
 def load_data(path: str) -> pd.DataFrame:
     """Load and preprocess CSV data with caching"""
+    return _load_data(path, _file_mtime(path))
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=128)  # Cache for 1 hour
+def _load_data(path: str, mtime: float) -> pd.DataFrame:
+    """Cached body of load_data, keyed on path and modification time"""
     try:
         if not os.path.exists(path):
             st.error(f"File not found: {path}")
             return pd.DataFrame()
             
-        df = pd.read_csv(path)
+        # Arrow's multithreaded parser infers numeric columns while parsing
+        df = pd.read_csv(path, engine='pyarrow')
         df.columns = df.columns.str.strip()
         df.dropna(subset=["Player Name"], inplace=True)
         df["Session Type"] = df["Session Type"].astype(str).str.strip().str.title()
         
-        # Convert metrics to numeric
+        # Low-cardinality labels as categoricals: integer codes for groupby and filtering
+        df["Session Type"] = df["Session Type"].astype("category")
+        df["Player Name"] = df["Player Name"].astype("category")
+        
+        # Convert metrics to numeric; only columns Arrow could not parse as numbers need coercion
         from core.constants import METRICS
         for col in METRICS:
-            if col in df.columns:
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
                 df[col] = pd.to_numeric(df[col], errors='coerce')
         
+        # Telemetry doesn't need double precision; float32 halves the bytes every metric scan reads
+        float_metrics = [col for col in METRICS if col in df.columns and pd.api.types.is_float_dtype(df[col])]
+        df[float_metrics] = df[float_metrics].astype(np.float32)
+        
         # Add timestamp if not present
         if 'timestamp' not in df.columns and 'date' not in df.columns:
             df['timestamp'] = pd.to_datetime(df.index, errors='coerce')
@@ -33,24 +68,95 @@ def load_data(path: str) -> pd.DataFrame:
         st.error(f"Error loading {path}: {str(e)}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=3600)
+def get_player_names(df: pd.DataFrame) -> List[str]:
+    """Sorted player names of a loaded frame, read off the categories without a row scan"""
+    names = df["Player Name"]
+    if isinstance(names.dtype, pd.CategoricalDtype):
+        # Loaded frames only carry observed categories; filtered frames may not
+        return sorted(names.cat.categories)
+    return sorted(names.dropna().unique())
+
+def filter_players(df: pd.DataFrame, players: List[str]) -> pd.DataFrame:
+    """Rows belonging to the given players, matched on integer category codes when possible"""
+    names = df["Player Name"]
+    if isinstance(names.dtype, pd.CategoricalDtype):
+        wanted = names.cat.categories.get_indexer(players)
+        mask = np.isin(names.cat.codes.to_numpy(), wanted[wanted >= 0])
+    else:
+        mask = names.isin(players).to_numpy()
+    return df[mask]
+
+def _ordered_union(dtypes: List[pd.CategoricalDtype]) -> Optional[pd.CategoricalDtype]:
+    """Ordered dtype covering every input when all are ordered and agree on relative order, else None"""
+    if not all(dtype.ordered for dtype in dtypes):
+        return None
+    widest = max(dtypes, key=lambda dtype: len(dtype.categories))
+    position = {category: idx for idx, category in enumerate(widest.categories)}
+    for dtype in dtypes:
+        positions = [position.get(category, -1) for category in dtype.categories]
+        if min(positions, default=0) < 0 or any(np.diff(positions) <= 0):
+            return None
+    return widest
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate frames, unifying shared categorical columns so the dtype survives"""
+    if not frames:
+        return pd.DataFrame()
+    
+    # Columns that are categorical in every frame get one common category set up front,
+    # otherwise concat falls back to object dtype and re-hashes every string
+    shared = set.intersection(*(set(df.columns) for df in frames))
+    for col in [c for c in frames[0].columns if c in shared]:
+        dtypes = [df[col].dtype for df in frames]
+        if not all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            continue
+        if all(dtype == dtypes[0] for dtype in dtypes):
+            # Identical dtypes (including ordered ones) already concatenate as categoricals
+            continue
+        dtype = _ordered_union(dtypes) or pd.CategoricalDtype(
+            union_categoricals([df[col] for df in frames], ignore_order=True).categories
+        )
+        frames = [df.assign(**{col: df[col].astype(dtype)}) for df in frames]
+    
+    return pd.concat(frames, ignore_index=True, copy=False)
+
 def load_multiple_files(file_dict: Dict[str, str]) -> pd.DataFrame:
-    """Load multiple files and concatenate them"""
-    all_data = []
-    for name, path in file_dict.items():
+    """Load multiple files and concatenate them; each file is cached individually"""
+    results = load_multiple_files_parallel(file_dict)
+    
+    # Keep the configured file order rather than thread completion order
+    all_data = [results[name].assign(Source=name) for name in file_dict
+                if not results[name].empty]
+    
+    return concat_frames(all_data)
+
+def load_all_matches(match_files: Dict[str, str]) -> pd.DataFrame:
+    """Load every match file into one frame tagged with Match and Match_Order"""
+    return _load_all_matches(file_keys(match_files))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_all_matches(match_items: tuple) -> pd.DataFrame:
+    """Cached body of load_all_matches, keyed on (name, path, mtime) in match order"""
+    match_dtype = pd.CategoricalDtype([match_name for match_name, _, _ in match_items])
+    all_matches = []
+    for idx, (match_name, path, _) in enumerate(match_items):
         df = load_data(path)
         if not df.empty:
-            df['Source'] = name
-            all_data.append(df)
+            match_col = pd.Categorical([match_name] * len(df), dtype=match_dtype)
+            all_matches.append(df.assign(Match=match_col, Match_Order=idx))
     
-    return pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
+    return concat_frames(all_matches)
 
-@st.cache_data(ttl=3600)
 def load_multiple_files_parallel(file_dict: Dict[str, str], max_workers: int = 4) -> Dict[str, pd.DataFrame]:
     """Load multiple files in parallel for better performance"""
     results = {}
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # Workers share the script context so cached loaders and st.error work inside threads
+    ctx = get_script_run_ctx()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    ) as executor:
         future_to_name = {executor.submit(load_data, path): name 
                          for name, path in file_dict.items()}
         
@@ -64,13 +170,32 @@ def load_multiple_files_parallel(file_dict: Dict[str, str], max_workers: int = 4
     
     return results
 
-@st.cache_data(ttl=3600)
 def load_event_data(file_path: str) -> pd.DataFrame:
     """Load event data from Excel file"""
+    return _load_event_data(file_path, _file_mtime(file_path))
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=128)
+def _load_event_data(file_path: str, mtime: float) -> pd.DataFrame:
+    """Cached body of load_event_data, keyed on path and modification time"""
     try:
-        xls = pd.ExcelFile(file_path)
-        df = xls.parse("Nacsport")
-        return df
+        return pd.read_excel(file_path, sheet_name="Nacsport", engine=EXCEL_ENGINE)
     except Exception as e:
         st.error(f"Error loading event data: {str(e)}")
         return pd.DataFrame()
+
+def load_all_events(event_files: Dict[str, str]) -> pd.DataFrame:
+    """Load every event workbook into one frame with a Match column"""
+    return _load_all_events(tuple((match, path, _file_mtime(path)) for match, path in event_files.items()))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_all_events(event_items: tuple) -> pd.DataFrame:
+    """Cached body of load_all_events, keyed on (match, path, mtime)"""
+    frames = {match: load_event_data(path) for match, path, _ in event_items}
+    frames = {match: df for match, df in frames.items() if not df.empty}
+    if not frames:
+        return pd.DataFrame()
+    
+    # concat keys tag every row with its match in one pass instead of a column write per frame
+    return (pd.concat(frames, names=["Match"], copy=False)
+            .reset_index(level="Match")
+            .reset_index(drop=True))
@@ -23,9 +23,10 @@ def setup_page_config():
         }
     )
 
-def setup_theme():
-    """Apply custom CSS theme"""
-    st.markdown(f"""
+@st.cache_data(show_spinner=False)
+def _render_base_css() -> str:
+    """Build the base CSS shared by every page; ThemeConfig does not change at runtime"""
+    return f"""
     <style>
         /* Main container styling */
         .main {{
@@ -44,6 +45,48 @@ def setup_theme():
             font-weight: 600;
         }}
         
+        /* Button styling */
+        .stButton > button {{
+            background-color: {ThemeConfig.PRIMARY_COLOR};
+            color: white;
+            border: none;
+            border-radius: 5px;
+            padding: 10px 20px;
+            font-weight: 600;
+            transition: all 0.3s;
+        }}
+        
+        .stButton > button:hover {{
+            background-color: {ThemeConfig.SECONDARY_COLOR};
+            transform: translateY(-2px);
+            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+        }}
+        
+        /* Team card styling */
+        .team-card {{
+            background-color: {ThemeConfig.CARD_BACKGROUND};
+            border: 2px solid {ThemeConfig.PRIMARY_COLOR};
+            border-radius: 15px;
+            padding: 30px;
+            text-align: center;
+            transition: all 0.3s;
+            cursor: pointer;
+            margin: 10px;
+        }}
+        
+        .team-card:hover {{
+            transform: translateY(-10px);
+            box-shadow: 0 10px 30px rgba(215, 38, 56, 0.4);
+            border-color: {ThemeConfig.SECONDARY_COLOR};
+        }}
+    </style>
+    """
+
+@st.cache_data(show_spinner=False)
+def _render_dashboard_css() -> str:
+    """Build the CSS only needed by the team dashboards"""
+    return f"""
+    <style>
         /* Metric cards */
         div[data-testid="metric-container"] {{
             background-color: {ThemeConfig.CARD_BACKGROUND};
@@ -65,23 +108,6 @@ def setup_theme():
             border-radius: 10px;
         }}
         
-        /* Button styling */
-        .stButton > button {{
-            background-color: {ThemeConfig.PRIMARY_COLOR};
-            color: white;
-            border: none;
-            border-radius: 5px;
-            padding: 10px 20px;
-            font-weight: 600;
-            transition: all 0.3s;
-        }}
-        
-        .stButton > button:hover {{
-            background-color: {ThemeConfig.SECONDARY_COLOR};
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-        }}
-        
         /* Expander styling */
         .streamlit-expanderHeader {{
             background-color: {ThemeConfig.CARD_BACKGROUND};
@@ -108,6 +134,15 @@ def setup_theme():
             transition: all 0.3s;
         }}
         
+        .metric-card-row {{
+            display: flex;
+            gap: 12px;
+        }}
+        
+        .metric-card-row > .custom-metric {{
+            flex: 1 1 0;
+        }}
+        
         .custom-metric:hover {{
             transform: translateY(-5px);
             box-shadow: 0 5px 15px rgba(215, 38, 56, 0.3);
@@ -124,23 +159,13 @@ def setup_theme():
             color: {ThemeConfig.TEXT_COLOR};
             opacity: 0.8;
         }}
-
-        /* Team card styling */
-        .team-card {{
-            background-color: {ThemeConfig.CARD_BACKGROUND};
-            border: 2px solid {ThemeConfig.PRIMARY_COLOR};
-            border-radius: 15px;
-            padding: 30px;
-            text-align: center;
-            transition: all 0.3s;
-            cursor: pointer;
-            margin: 10px;
-        }}
-        
-        .team-card:hover {{
-            transform: translateY(-10px);
-            box-shadow: 0 10px 30px rgba(215, 38, 56, 0.4);
-            border-color: {ThemeConfig.SECONDARY_COLOR};
-        }}
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def setup_theme_base():
+    """Apply the base CSS theme"""
+    st.markdown(_render_base_css(), unsafe_allow_html=True)
+
+def setup_theme_dashboard():
+    """Apply the dashboard CSS theme (metric cards, tabs, tables, expanders)"""
+    st.markdown(_render_dashboard_css(), unsafe_allow_html=True)
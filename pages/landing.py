@@ -2,8 +2,20 @@
 import streamlit as st
 from teams_config import TEAMS_CONFIG
 from core.theme import ThemeConfig
+from functools import lru_cache
 from components.sidebar import create_circular_image
 
+@lru_cache(maxsize=None)
+def _logo_fallback_html(initials: str) -> str:
+    """Circular initials badge shown when a team logo is unavailable"""
+    return f"""
+    <div style='width: 150px; height: 150px; background-color: {ThemeConfig.PRIMARY_COLOR}; 
+                border-radius: 50%; margin: 0 auto; display: flex; 
+                align-items: center; justify-content: center;'>
+        <h2 style='color: white; margin: 0;'>{initials}</h2>
+    </div>
+    """
+
 def render_landing_page():
     """Render the landing page for team selection"""
     # Header
@@ -37,32 +49,16 @@ def render_landing_page():
                         st.session_state.selected_team = team_name
                         st.rerun()
                     
-                    # Team logo - centered using columns
-                    logo_col1, logo_col2, logo_col3 = st.columns([1, 2, 1])
-                    with logo_col2:
-                        try:
-                            logo = create_circular_image(team_config["logo"])
-                            if logo:
-                                st.image(logo, use_container_width=True)
-                            else:
-                                st.markdown(f"""
-                                <div style='width: 150px; height: 150px; background-color: {ThemeConfig.PRIMARY_COLOR}; 
-                                            border-radius: 50%; margin: 0 auto; display: flex; 
-                                            align-items: center; justify-content: center;'>
-                                    <h2 style='color: white; margin: 0;'>{team_name[:3]}</h2>
-                                </div>
-                                """, unsafe_allow_html=True)
-                        except:
-                            st.markdown(f"""
-                            <div style='width: 150px; height: 150px; background-color: {ThemeConfig.PRIMARY_COLOR}; 
-                                        border-radius: 50%; margin: 0 auto; display: flex; 
-                                        align-items: center; justify-content: center;'>
-                                <h2 style='color: white; margin: 0;'>{team_name[:3]}</h2>
-                            </div>
-                            """, unsafe_allow_html=True)
+                    # Team logo - centered using columns (create_circular_image returns None on failure)
+                    logo = create_circular_image(team_config["logo"])
+                    if logo:
+                        logo_col1, logo_col2, logo_col3 = st.columns([1, 2, 1])
+                        with logo_col2:
+                            st.image(logo, use_container_width=True)
                     
-                    # Team info - ensure text is centered
-                    st.markdown(f"""
+                    # Initials badge (when there is no logo), team info and spacer in one message
+                    badge_html = "" if logo else _logo_fallback_html(team_name[:3])
+                    card_html = f"""
                     <div style='text-align: center; width: 100%;'>
                         <h3 style='color: {ThemeConfig.PRIMARY_COLOR}; margin: 10px 0;'>{team_name}</h3>
                         <p style='color: {ThemeConfig.TEXT_COLOR}; opacity: 0.8; margin: 5px 0;'>{team_config['description']}</p>
@@ -70,6 +66,9 @@ def render_landing_page():
                             {len(team_config['match_files'])} Matches | {len(team_config['training_files'])} Training Sessions
                         </p>
                     </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown("<br>", unsafe_allow_html=True)
+                    <br>
+                    """
+                    # Strip indentation and blank lines so markdown keeps the fragments as one HTML block
+                    # instead of turning the deeply indented card into a code block
+                    lines = (line.strip() for fragment in (badge_html, card_html) for line in fragment.splitlines())
+                    st.markdown("\n".join(line for line in lines if line), unsafe_allow_html=True)
@@ -5,11 +5,11 @@ import numpy as np
 from PIL import Image
 import plotly.express as px
 import plotly.graph_objects as go
-from core.data_loader import load_data, load_event_data
+from core.data_loader import load_data, load_event_data, load_all_matches, load_all_events, get_player_names
 from core.constants import METRICS
 from core.theme import ThemeConfig
 from components.metrics import create_metric_card, create_performance_summary
-from components.charts import create_plotly_radar, create_performance_bar_chart, create_trend_line_chart
+from components.charts import create_plotly_radar, create_faceted_performance_bar_chart, create_trend_line_chart
 from components.ai_assistant import display_ai_assistant
 from utils.calculations import calculate_percentile_values
 
@@ -30,7 +30,7 @@ def render_match_report(api_key: str, team_config: dict):
     
     # Load data
     if selected_match == "All Matches (Average)":
-        df = pd.concat([load_data(path) for path in MATCH_FILES.values()], ignore_index=True)
+        df = load_all_matches(MATCH_FILES)
     else:
         df = load_data(MATCH_FILES[selected_match])
     
@@ -42,15 +42,16 @@ def render_match_report(api_key: str, team_config: dict):
     half_option = st.sidebar.selectbox("Select Half", ["Total", "First Half", "Second Half"])
     
     # Player selection
-    players = df["Player Name"].unique().tolist()
+    players = get_player_names(df)
     selected_player = st.sidebar.selectbox("Select Player", ["All"] + players)
     
-    # Filter data
-    match_df = df.copy()
+    # Filter data with one combined mask; no copy when nothing is filtered
+    mask = np.ones(len(df), dtype=bool)
     if selected_player != "All":
-        match_df = match_df[match_df["Player Name"] == selected_player]
+        mask &= df["Player Name"].values == selected_player
     if half_option != "Total":
-        match_df = match_df[match_df["Session Type"] == half_option]
+        mask &= df["Session Type"].values == half_option
+    match_df = df if mask.all() else df[mask]
     
     # Display match title
     st.markdown(f"<h2 style='color: {ThemeConfig.PRIMARY_COLOR};'>🏆 {selected_match}</h2>", unsafe_allow_html=True)
@@ -61,7 +62,7 @@ def render_match_report(api_key: str, team_config: dict):
     # Calculate and display metrics
     display_match_metrics(match_df, api_key)
     
-    # Tabbed content
+    # Tabbed content; each tab body is a fragment so its own widgets only rerun that tab
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["⚡ Event Analysis", "📊 Performance Charts", 
                                            "📈 Trends", "🎯 Radar Analysis", "📋 Data Table"])
     
@@ -118,28 +119,19 @@ def display_match_metrics(match_df: pd.DataFrame, api_key: str):
     
     display_ai_assistant("Match Overview Analysis", match_summary, api_key)
 
+@st.fragment
 def render_event_analysis(selected_match: str, api_key: str, EVENT_FILES: dict, 
                          EVENT_IMAGES: dict, match_df: pd.DataFrame):
     """Render event analysis section"""
     st.markdown("### Match Event Analysis")
     
     if selected_match == "All Matches (Average)":
-        # Load all event data
-        all_events = []
-        for match, file_path in EVENT_FILES.items():
-            try:
-                df_temp = load_event_data(file_path)
-                if not df_temp.empty:
-                    df_temp["Match"] = match
-                    all_events.append(df_temp)
-            except Exception as e:
-                st.warning(f"Could not load event data for {match}: {e}")
+        # Load all event data (cached; per-file load errors are reported by load_event_data)
+        df_events = load_all_events(EVENT_FILES)
         
-        if not all_events:
+        if df_events.empty:
             st.error("No event data available across matches.")
             return
-        
-        df_events = pd.concat(all_events, ignore_index=True)
     else:
         # Load single match event data
         xls_path = EVENT_FILES.get(selected_match)
@@ -158,6 +150,7 @@ def render_event_analysis(selected_match: str, api_key: str, EVENT_FILES: dict,
     # Shot map
     render_shot_map(df_events, selected_match)
 
+@st.fragment
 def render_performance_charts(match_df: pd.DataFrame, api_key: str):
     """Render performance charts"""
     st.markdown("### Performance Metrics by Player")
@@ -178,41 +171,32 @@ def render_performance_charts(match_df: pd.DataFrame, api_key: str):
         st.warning("Please select at least one metric to display.")
         return
     
-    # Create charts for each metric
+    # One figure for all selected metrics
+    fig = create_faceted_performance_bar_chart(match_df, selected_metrics, "Performance Metrics by Player")
+    st.plotly_chart(fig, use_container_width=True, key="match_performance_bars")
+    
+    # Top performers: one groupby for every selected metric, then top 3 per column
+    player_means = match_df.groupby("Player Name", observed=True)[selected_metrics].mean()
     for metric in selected_metrics:
-        if metric in match_df.columns:
-            fig = create_performance_bar_chart(match_df, metric, f"{metric} by Player")
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Top performers
-            top_performers = match_df.groupby("Player Name")[metric].mean().nlargest(3)
-            with st.expander(f"🏆 Top 3 Performers - {metric}"):
-                for idx, (player, value) in enumerate(top_performers.items(), 1):
-                    medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉"
-                    st.markdown(f"{medal} **{player}**: {value:.2f}")
+        top_performers = player_means[metric].nlargest(3)
+        with st.expander(f"🏆 Top 3 Performers - {metric}"):
+            for idx, (player, value) in enumerate(top_performers.items(), 1):
+                medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉"
+                st.markdown(f"{medal} **{player}**: {value:.2f}")
 
+@st.fragment
 def render_trend_analysis(selected_match: str, match_df: pd.DataFrame, 
                          api_key: str, MATCH_FILES: dict):
     """Render trend analysis"""
     if selected_match == "All Matches (Average)":
         st.markdown("### Team Performance Trends")
         
-        # Load all match data with proper ordering
-        all_matches_data = []
-        match_order = list(MATCH_FILES.keys())
+        # Load all match data with proper ordering (shared cache with the match selector)
+        full_df = load_all_matches(MATCH_FILES)
         
-        for idx, (match_name, file_path) in enumerate(MATCH_FILES.items()):
-            df_temp = load_data(file_path)
-            if not df_temp.empty:
-                df_temp["Match"] = match_name
-                df_temp["Match_Order"] = idx
-                all_matches_data.append(df_temp)
-        
-        if not all_matches_data:
+        if full_df.empty:
             st.warning("No match data available for trend analysis.")
             return
-            
-        full_df = pd.concat(all_matches_data, ignore_index=True)
         
         # Team trends
         render_team_trends(full_df, api_key)
@@ -222,6 +206,7 @@ def render_trend_analysis(selected_match: str, match_df: pd.DataFrame,
     else:
         st.info("Trend analysis is only available when 'All Matches (Average)' is selected.")
 
+@st.fragment
 def render_radar_analysis(match_df: pd.DataFrame, full_df: pd.DataFrame, 
                          half_option: str, selected_player: str, api_key: str):
     """Render radar analysis"""
@@ -241,6 +226,7 @@ def render_radar_analysis(match_df: pd.DataFrame, full_df: pd.DataFrame,
         render_single_player_radar(match_df, full_df, selected_player, 
                                   available_metrics, half_option, api_key)
 
+@st.fragment
 def render_data_table(match_df: pd.DataFrame):
     """Render data table with export options"""
     st.markdown("### Raw Data View")
@@ -283,19 +269,23 @@ def render_data_table(match_df: pd.DataFrame):
         
         # Display full data
         st.markdown("#### Full Dataset")
-        st.dataframe(display_df, use_container_width=True, height=400)
+        st.dataframe(display_df, use_container_width=True, height=400, hide_index=True)
         
         # Export option
-        csv = display_df.to_csv(index=False)
         st.download_button(
             label="📥 Download as CSV",
-            data=csv,
+            data=_to_csv_bytes(display_df),
             file_name=f"match_data_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv"
         )
 
 # Helper functions for match report
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a table to CSV once per distinct view instead of on every rerun"""
+    return df.to_csv(index=False).encode()
+
 def display_event_summary(df_events: pd.DataFrame, selected_match: str):
     """Display event summary statistics"""
     # Implementation of event summary display
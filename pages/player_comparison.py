@@ -2,12 +2,11 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-from core.data_loader import load_data, load_multiple_files
+from core.data_loader import load_data, load_multiple_files, concat_frames, filter_players
 from core.constants import METRICS, PERFORMANCE_WEIGHTS
 from core.theme import ThemeConfig
-from components.metrics import create_metric_card, calculate_performance_score
-from components.charts import create_plotly_radar, create_trend_line_chart, create_heatmap
+from components.metrics import create_metric_card, calculate_performance_score, rank_percentiles, calculate_metric_stats
+from components.charts import create_plotly_radar, create_trend_line_chart, create_heatmap, create_normalized_heatmap
 from components.ai_assistant import display_ai_assistant
 
 def render_player_comparison(api_key: str, team_config: dict):
@@ -48,7 +47,7 @@ def render_player_comparison(api_key: str, team_config: dict):
         return
     
     # Filter data
-    comparison_df = df[df["Player Name"].isin(selected_players)]
+    comparison_df = filter_players(df, selected_players)
     
     # Comparison type
     comparison_type = st.radio(
@@ -75,7 +74,7 @@ def load_comparison_data(data_source: str, match_files: dict, training_files: di
     else:  # Combined
         match_df = load_multiple_files(match_files)
         training_df = load_multiple_files(training_files)
-        return pd.concat([match_df, training_df], ignore_index=True)
+        return concat_frames([df for df in (match_df, training_df) if not df.empty])
 
 def render_overall_performance_comparison(df: pd.DataFrame, players: list, 
                                         full_df: pd.DataFrame, api_key: str):
@@ -88,14 +87,17 @@ def render_overall_performance_comparison(df: pd.DataFrame, players: list,
     
     # Calculate averages
     available_metrics = [m for m in METRICS if m in df.columns]
-    player_averages = df.groupby("Player Name")[available_metrics].mean()
+    player_averages = df.groupby("Player Name", observed=True)[available_metrics].mean()
     
     # Performance scores
     display_performance_scores(player_averages, players, available_metrics)
     
     # AI Assistant
-    overall_summary = create_overall_comparison_summary(player_averages, players)
-    display_ai_assistant("Overall Performance Comparison", overall_summary, api_key)
+    display_ai_assistant(
+        "Overall Performance Comparison",
+        lambda: create_overall_comparison_summary(player_averages, players),
+        api_key
+    )
     
     # Detailed metrics comparison
     display_detailed_metrics_comparison(df, player_averages, players, available_metrics, full_df)
@@ -132,8 +134,11 @@ def render_head_to_head_comparison(df: pd.DataFrame, players: list, api_key: str
     display_win_loss_summary(p1_data, p2_data, player1, player2)
     
     # AI Assistant
-    h2h_summary = create_head_to_head_summary(p1_data, p2_data, player1, player2)
-    display_ai_assistant("Head-to-Head Comparison", h2h_summary, api_key)
+    display_ai_assistant(
+        "Head-to-Head Comparison",
+        lambda: create_head_to_head_summary(p1_data, p2_data, player1, player2),
+        api_key
+    )
 
 def render_trend_comparison(df: pd.DataFrame, players: list, api_key: str, match_files: dict):
     """Render trend comparison analysis"""
@@ -162,8 +167,11 @@ def render_trend_comparison(df: pd.DataFrame, players: list, api_key: str, match
         display_growth_analysis(df, players, trend_metric)
         
         # AI Assistant
-        trend_summary = create_trend_comparison_summary(df, players, trend_metric)
-        display_ai_assistant("Trend Comparison Analysis", trend_summary, api_key)
+        display_ai_assistant(
+            "Trend Comparison Analysis",
+            lambda: create_trend_comparison_summary(df, players, trend_metric),
+            api_key
+        )
 
 def render_statistical_comparison(df: pd.DataFrame, players: list, api_key: str):
     """Render statistical comparison"""
@@ -188,15 +196,14 @@ def display_performance_scores(player_averages: pd.DataFrame, players: list, met
     """Display performance score cards"""
     st.markdown("#### Performance Scores")
     
-    performance_scores = []
-    for player in players:
-        if player in player_averages.index:
-            score = sum(player_averages.loc[player, metric] * PERFORMANCE_WEIGHTS.get(metric, 0.1) 
-                       for metric in metrics if metric in PERFORMANCE_WEIGHTS)
-            performance_scores.append({"Player": player, "Score": score})
+    scored_players = [player for player in players if player in player_averages.index]
+    scored_metrics = [metric for metric in metrics if metric in PERFORMANCE_WEIGHTS]
     
-    if performance_scores:
-        scores_df = pd.DataFrame(performance_scores).sort_values("Score", ascending=False)
+    if scored_players:
+        # Weighted sum for every player in one matrix-vector product
+        weights = np.array([PERFORMANCE_WEIGHTS[metric] for metric in scored_metrics], dtype=np.float64)
+        scores = player_averages.loc[scored_players, scored_metrics].to_numpy(dtype=np.float64) @ weights
+        scores_df = pd.DataFrame({"Player": scored_players, "Score": scores}).sort_values("Score", ascending=False)
         
         # Display performance cards
         cols = st.columns(len(players))
@@ -238,51 +245,47 @@ def display_detailed_metrics_comparison(df: pd.DataFrame, player_averages: pd.Da
     """Display detailed metrics comparison"""
     st.markdown("#### Detailed Metrics")
     
-    # Create spider plot
-    percentile_data = []
-    for player in players:
-        if player in player_averages.index:
-            player_percentiles = []
-            for metric in metrics:
-                all_values = full_df[metric].dropna()
-                player_value = player_averages.loc[player, metric]
-                percentile = (all_values < player_value).sum() / len(all_values) * 100
-                player_percentiles.append(percentile)
-            percentile_data.append(player_percentiles)
-    
-    if percentile_data:
+    # Create spider plot: one searchsorted per metric over all players at once
+    ranked_players = [player for player in players if player in player_averages.index]
+    
+    if ranked_players and metrics:
+        metric_stats = calculate_metric_stats(full_df, tuple(metrics))
+        player_values = player_averages.loc[ranked_players, metrics].to_numpy(dtype=np.float64)
+        percentile_matrix = np.column_stack([
+            rank_percentiles(metric_stats[metric]["sorted"], player_values[:, j])
+            for j, metric in enumerate(metrics)
+        ])
+        
         fig = create_plotly_radar(
-            percentile_data,
+            percentile_matrix.tolist(),
             metrics,
             "Player Performance Comparison - Percentiles",
-            players
+            ranked_players
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="comparison_percentile_radar")
+
+def _normalize_player_averages(player_averages: pd.DataFrame) -> pd.DataFrame:
+    """Min-max scale every metric column"""
+    col_min = player_averages.min()
+    return (player_averages - col_min) / (player_averages.max() - col_min)
 
 def display_strengths_weaknesses_matrix(player_averages: pd.DataFrame, players: list, metrics: list):
     """Display strengths and weaknesses matrix"""
     st.markdown("#### Strengths & Weaknesses Matrix")
     
     if not player_averages.empty:
-        # Create heatmap
-        normalized_data = (player_averages.loc[players] - player_averages.min()) / (player_averages.max() - player_averages.min())
-        
-        fig = px.imshow(
-            normalized_data.T,
-            labels=dict(x="Player", y="Metric", color="Normalized Score"),
-            color_continuous_scale="RdYlGn",
-            aspect="auto",
-            title="Performance Heatmap (Normalized)",
-            height=400
-        )
+        # The figure is cached per (players, metrics) slice
+        normalized_data = _normalize_player_averages(player_averages)
+        ranked_players = tuple(player for player in players if player in normalized_data.index)
         
-        fig.update_layout(
-            plot_bgcolor=ThemeConfig.CARD_BACKGROUND,
-            paper_bgcolor=ThemeConfig.BACKGROUND_COLOR,
-            font=dict(color=ThemeConfig.TEXT_COLOR)
+        fig = create_normalized_heatmap(
+            normalized_data,
+            ranked_players,
+            tuple(metric for metric in metrics if metric in normalized_data.columns),
+            "Performance Heatmap (Normalized)"
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="comparison_strengths_heatmap")
 
 # Additional helper functions would continue here...
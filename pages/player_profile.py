@@ -1,15 +1,18 @@
 """Player profile functionality"""
+import heapq
 import streamlit as st
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from datetime import datetime
+from typing import Optional
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-from core.data_loader import load_data
+from core.data_loader import load_data, file_keys, concat_frames, get_player_names
 from core.constants import METRICS, PERFORMANCE_WEIGHTS
 from core.theme import ThemeConfig
-from components.metrics import create_metric_card, calculate_performance_score
+from components.metrics import create_metric_card, create_metric_card_row, score_against_team_means, rank_percentiles, calculate_metric_stats
 from components.charts import create_plotly_radar, create_trend_line_chart
 from components.ai_assistant import display_ai_assistant, get_ai_coach_insights
 
@@ -21,128 +24,185 @@ def render_player_profile(api_key: str, team_config: dict):
     st.markdown(f"<h2 style='color: {ThemeConfig.PRIMARY_COLOR};'>📊 Player Profile</h2>", 
                 unsafe_allow_html=True)
     
-    # Load all available data
-    all_data = load_all_player_data(MATCH_FILES, TRAINING_FILES)
+    # Only the roster and the selected player's rows are pulled from cache on each rerun
+    players, available_metrics = load_player_roster(MATCH_FILES, TRAINING_FILES)
     
-    if all_data.empty:
+    if not players:
         st.warning("No data available for player profiles.")
         return
     
+    # Team-wide reference stats depend only on the files, not the selected player
+    team_stats = load_team_stats(MATCH_FILES, TRAINING_FILES)
+    
     # Player selection
-    available_players = sorted(all_data["Player Name"].unique())
     selected_player = st.sidebar.selectbox(
         "Select Player:",
-        available_players,
+        players,
         key="profile_player_selector"
     )
     
-    # Filter player data
-    player_data = all_data[all_data["Player Name"] == selected_player]
+    player_data = load_player_data(MATCH_FILES, TRAINING_FILES, selected_player)
     
     if player_data.empty:
         st.warning(f"No data available for {selected_player}.")
         return
     
+    # Averages shared by the rating, percentiles and report
+    player_avg = player_data[available_metrics].mean()
+    
+    # Count sessions per data source once; summary and report both reuse it
+    source_counts = player_data["Data Source"].value_counts()
+    match_count = int(source_counts.get("Match", 0))
+    training_count = int(source_counts.get("Training", 0))
+    
     # Display player header
     st.markdown(f"### {selected_player} - Complete Performance Profile")
     
     # Overview metrics
-    display_player_overview_metrics(player_data, api_key)
+    display_player_overview_metrics(player_data, available_metrics, match_count, training_count, api_key)
     
     # Profile tabs
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Overview", "📈 Performance Trends", 
                                            "💪 Strengths Analysis", "📅 Session History", "📄 Report"])
     
     with tab1:
-        render_player_overview(player_data, all_data, api_key)
+        render_player_overview(player_data, available_metrics, player_avg, team_stats, api_key)
     
     with tab2:
-        render_player_trends(player_data, api_key)
+        render_player_trends(player_data, available_metrics, api_key)
     
     with tab3:
-        render_player_strengths(player_data, all_data, api_key)
+        render_player_strengths(player_data, available_metrics, player_avg, team_stats, api_key)
     
     with tab4:
-        render_session_history(player_data)
+        render_session_history(player_data, available_metrics)
     
     with tab5:
-        render_player_report(player_data, all_data, selected_player, api_key)
+        render_player_report(player_data, available_metrics, player_avg, match_count, training_count,
+                             team_stats, selected_player, api_key)
+
+DATA_SOURCE_DTYPE = pd.CategoricalDtype(["Match", "Training"])
 
 def load_all_player_data(match_files: dict, training_files: dict) -> pd.DataFrame:
     """Load all available player data"""
-    all_match_data = pd.concat([load_data(path) for path in match_files.values()], ignore_index=True)
-    all_training_data = pd.concat([load_data(path) for path in training_files.values()], ignore_index=True)
-    
-    # Add data source column
-    all_match_data["Data Source"] = "Match"
-    all_training_data["Data Source"] = "Training"
-    
-    # Combine all data
-    return pd.concat([all_match_data, all_training_data], ignore_index=True)
+    return _load_all_player_data(file_keys(match_files), file_keys(training_files))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_all_player_data(match_items: tuple, training_items: tuple) -> pd.DataFrame:
+    """Cached body of load_all_player_data, keyed on (name, path, mtime) of every file"""
+    # Tag each file with its source and concatenate once
+    frames = []
+    for source, items in (("Match", match_items), ("Training", training_items)):
+        for _, path, _ in items:
+            df = load_data(path)
+            if not df.empty:
+                source_col = pd.Categorical([source] * len(df), dtype=DATA_SOURCE_DTYPE)
+                frames.append(df.assign(**{"Data Source": source_col}))
+    
+    return concat_frames(frames)
+
+def load_player_roster(match_files: dict, training_files: dict) -> tuple:
+    """Sorted player names and the metrics present in the combined data"""
+    return _player_roster(file_keys(match_files), file_keys(training_files))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _player_roster(match_items: tuple, training_items: tuple) -> tuple:
+    """Cached body of load_player_roster; columns are the same for every player"""
+    all_data = _load_all_player_data(match_items, training_items)
+    if all_data.empty:
+        return [], []
+    return get_player_names(all_data), [m for m in METRICS if m in all_data.columns]
+
+def load_player_data(match_files: dict, training_files: dict, player: str) -> pd.DataFrame:
+    """Rows for one player from the combined match and training data"""
+    return _load_player_data(file_keys(match_files), file_keys(training_files), player)
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=64)
+def _load_player_data(match_items: tuple, training_items: tuple, player: str) -> pd.DataFrame:
+    """Cached per-player slice, so revisiting a player skips masking the whole table"""
+    all_data = _load_all_player_data(match_items, training_items)
+    return all_data[all_data["Player Name"] == player]
+
+def load_team_stats(match_files: dict, training_files: dict) -> dict:
+    """Per-metric team reference stats (mean, sorted values) for the configured files"""
+    return _team_stats(file_keys(match_files), file_keys(training_files))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _team_stats(match_items: tuple, training_items: tuple) -> dict:
+    """Cached body of load_team_stats, keyed like _load_all_player_data so reruns skip hashing the frame"""
+    return calculate_metric_stats(_load_all_player_data(match_items, training_items), tuple(METRICS))
 
-def display_player_overview_metrics(player_data: pd.DataFrame, api_key: str):
+def team_performance_score(player_avg: pd.Series, team_stats: dict) -> float:
+    """Weighted performance score of one player's averages against the cached team means"""
+    team_means = pd.Series({metric: stats["mean"] for metric, stats in team_stats.items()}, dtype=np.float64)
+    return float(score_against_team_means(player_avg.to_frame().T, team_means).iloc[0])
+
+def display_player_overview_metrics(player_data: pd.DataFrame, available_metrics: list,
+                                    match_count: int, training_count: int, api_key: str):
     """Display player overview metrics"""
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
     total_sessions = player_data.shape[0]
-    available_metrics = [m for m in METRICS if m in player_data.columns]
-    
-    with col1:
-        st.markdown(create_metric_card("Sessions", f"{total_sessions}"), unsafe_allow_html=True)
+    cards = [create_metric_card("Sessions", f"{total_sessions}")]
     
     if "Total Distance" in available_metrics:
-        with col2:
-            avg_distance = player_data["Total Distance"].mean()
-            st.markdown(create_metric_card("Avg Distance", f"{avg_distance:.2f} km"), unsafe_allow_html=True)
+        avg_distance = np.nanmean(player_data["Total Distance"].to_numpy())
+        cards.append(create_metric_card("Avg Distance", f"{avg_distance:.2f} km"))
     
     if "Max Speed" in available_metrics:
-        with col3:
-            max_speed_recorded = player_data["Max Speed"].max()
-            st.markdown(create_metric_card("Top Speed", f"{max_speed_recorded:.1f} km/h"), unsafe_allow_html=True)
+        max_speed_recorded = np.nanmax(player_data["Max Speed"].to_numpy())
+        cards.append(create_metric_card("Top Speed", f"{max_speed_recorded:.1f} km/h"))
     
     if "No of Sprints" in available_metrics:
-        with col4:
-            total_sprints = player_data["No of Sprints"].sum()
-            st.markdown(create_metric_card("Total Sprints", f"{total_sprints}"), unsafe_allow_html=True)
+        total_sprints = np.nansum(player_data["No of Sprints"].to_numpy())
+        cards.append(create_metric_card("Total Sprints", f"{total_sprints}"))
     
     if "Accelerations" in available_metrics and "Decelerations" in available_metrics:
-        with col5:
-            avg_load = (player_data["Accelerations"].mean() + player_data["Decelerations"].mean())
-            st.markdown(create_metric_card("Avg Load", f"{avg_load:.0f}"), unsafe_allow_html=True)
+        avg_load = (np.nanmean(player_data["Accelerations"].to_numpy()) +
+                    np.nanmean(player_data["Decelerations"].to_numpy()))
+        cards.append(create_metric_card("Avg Load", f"{avg_load:.0f}"))
+    
+    # All cards go out as one element
+    st.markdown(create_metric_card_row(cards), unsafe_allow_html=True)
     
     # AI Assistant for Profile Overview
-    profile_summary = create_profile_summary(player_data, total_sessions)
-    display_ai_assistant("Player Profile Overview", profile_summary, api_key)
+    display_ai_assistant(
+        "Player Profile Overview",
+        lambda: create_profile_summary(player_data, available_metrics, total_sessions, match_count,
+                                       training_count),
+        api_key
+    )
 
-def render_player_overview(player_data: pd.DataFrame, all_data: pd.DataFrame, api_key: str):
+@st.fragment
+def render_player_overview(player_data: pd.DataFrame, available_metrics: list,
+                           player_avg: pd.Series, team_stats: dict, api_key: str):
     """Render player overview section"""
     st.markdown("### Performance Overview")
     
-    # Split by data source
-    match_data = player_data[player_data["Data Source"] == "Match"]
-    training_data = player_data[player_data["Data Source"] == "Training"]
+    # One grouped mean covers both data sources
+    means_by_source = player_data.groupby("Data Source", sort=False, observed=True)[available_metrics].mean()
     
     col1, col2 = st.columns(2)
     
     with col1:
-        display_data_source_metrics(match_data, "Match Performance", ThemeConfig.PRIMARY_COLOR)
+        display_data_source_metrics(means_by_source.loc["Match"] if "Match" in means_by_source.index else None,
+                                    "Match Performance", ThemeConfig.PRIMARY_COLOR)
     
     with col2:
-        display_data_source_metrics(training_data, "Training Performance", ThemeConfig.SECONDARY_COLOR)
+        display_data_source_metrics(means_by_source.loc["Training"] if "Training" in means_by_source.index else None,
+                                    "Training Performance", ThemeConfig.SECONDARY_COLOR)
     
     # Performance rating
-    display_performance_rating(player_data, all_data)
+    display_performance_rating(player_avg, team_stats)
 
-def render_player_trends(player_data: pd.DataFrame, api_key: str):
+@st.fragment
+def render_player_trends(player_data: pd.DataFrame, available_metrics: list, api_key: str):
     """Render player performance trends"""
     st.markdown("### Performance Trends")
     
-    # Add session numbers for trending
+    # Session numbers for trending are only an x-axis, so keep them out of the frame
     player_data = player_data.sort_index()
-    player_data["Session_Number"] = range(1, len(player_data) + 1)
+    session_numbers = np.arange(1, len(player_data) + 1, dtype=np.int32)
     
     # Metric selection
-    available_metrics = [m for m in METRICS if m in player_data.columns]
     trend_metrics = st.multiselect(
         "Select metrics to analyze:",
         available_metrics,
@@ -155,18 +215,23 @@ def render_player_trends(player_data: pd.DataFrame, api_key: str):
     
     # Create trend charts
     for metric in trend_metrics:
-        display_metric_trend(player_data, metric)
+        display_metric_trend(player_data, metric, session_numbers)
     
     # AI Assistant for Trend Analysis
-    trends_summary = create_trends_summary(player_data, trend_metrics)
-    display_ai_assistant("Player Trend Analysis", trends_summary, api_key)
+    display_ai_assistant(
+        "Player Trend Analysis",
+        lambda: create_trends_summary(player_data, trend_metrics),
+        api_key
+    )
 
-def render_player_strengths(player_data: pd.DataFrame, all_data: pd.DataFrame, api_key: str):
+@st.fragment
+def render_player_strengths(player_data: pd.DataFrame, available_metrics: list,
+                            player_avg: pd.Series, team_stats: dict, api_key: str):
     """Render player strengths analysis"""
     st.markdown("### Strengths & Development Areas")
     
     # Calculate percentiles
-    percentiles = calculate_player_percentiles(player_data, all_data)
+    percentiles = calculate_player_percentiles(player_avg, team_stats)
     
     # Create radar chart
     display_percentile_radar(percentiles, player_data["Player Name"].iloc[0])
@@ -175,13 +240,17 @@ def render_player_strengths(player_data: pd.DataFrame, all_data: pd.DataFrame, a
     display_strengths_weaknesses(percentiles)
     
     # AI Assistant for Strengths Analysis
-    strengths_summary = create_strengths_summary(percentiles)
-    display_ai_assistant("Strengths & Development Analysis", strengths_summary, api_key)
+    display_ai_assistant(
+        "Strengths & Development Analysis",
+        lambda: create_strengths_summary(percentiles),
+        api_key
+    )
     
     # Performance consistency
-    display_performance_consistency(player_data)
+    display_performance_consistency(player_data, available_metrics)
 
-def render_session_history(player_data: pd.DataFrame):
+@st.fragment
+def render_session_history(player_data: pd.DataFrame, available_metrics: list):
     """Render detailed session history"""
     st.markdown("### Session History")
     
@@ -196,7 +265,6 @@ def render_session_history(player_data: pd.DataFrame):
         )
     
     with col2:
-        available_metrics = [m for m in METRICS if m in player_data.columns]
         metric_to_highlight = st.selectbox(
             "Highlight metric:",
             ["None"] + available_metrics,
@@ -209,7 +277,9 @@ def render_session_history(player_data: pd.DataFrame):
     # Session statistics
     display_session_statistics(player_data)
 
-def render_player_report(player_data: pd.DataFrame, all_data: pd.DataFrame, 
+@st.fragment
+def render_player_report(player_data: pd.DataFrame, available_metrics: list, player_avg: pd.Series,
+                        match_count: int, training_count: int, team_stats: dict,
                         player_name: str, api_key: str):
     """Generate comprehensive player report"""
     st.markdown("### Player Report")
@@ -239,13 +309,14 @@ def render_player_report(player_data: pd.DataFrame, all_data: pd.DataFrame,
     )
     
     if st.button("Generate Report", type="primary", key="generate_report_btn"):
-        generate_player_report(player_data, all_data, player_name, api_key, include_sections)
+        generate_player_report(player_data, available_metrics, player_avg, match_count, training_count,
+                               team_stats, player_name, api_key, include_sections)
 
 # Helper functions for player profile
 
-def create_profile_summary(player_data: pd.DataFrame, total_sessions: int) -> str:
+def create_profile_summary(player_data: pd.DataFrame, available_metrics: list, total_sessions: int,
+                           match_count: int, training_count: int) -> str:
     """Create profile summary for AI assistant"""
-    available_metrics = [m for m in METRICS if m in player_data.columns]
     
     summary = f"""
     Player Profile: {player_data['Player Name'].iloc[0]}
@@ -255,30 +326,25 @@ def create_profile_summary(player_data: pd.DataFrame, total_sessions: int) -> st
     """
     
     if "Total Distance" in available_metrics:
-        summary += f"\n- Average Distance: {player_data['Total Distance'].mean():.2f} km"
+        summary += f"\n- Average Distance: {np.nanmean(player_data['Total Distance'].to_numpy()):.2f} km"
     if "Max Speed" in available_metrics:
-        summary += f"\n- Top Speed Recorded: {player_data['Max Speed'].max():.1f} km/h"
+        summary += f"\n- Top Speed Recorded: {np.nanmax(player_data['Max Speed'].to_numpy()):.1f} km/h"
     if "No of Sprints" in available_metrics:
-        summary += f"\n- Total Sprints: {player_data['No of Sprints'].sum()}"
+        summary += f"\n- Total Sprints: {np.nansum(player_data['No of Sprints'].to_numpy())}"
     
-    match_count = len(player_data[player_data['Data Source']=='Match'])
-    training_count = len(player_data[player_data['Data Source']=='Training'])
     summary += f"\n\nData includes {match_count} matches and {training_count} training sessions."
     
     return summary
 
-def display_data_source_metrics(data: pd.DataFrame, title: str, color: str):
-    """Display metrics for a specific data source"""
+def display_data_source_metrics(metrics: Optional[pd.Series], title: str, color: str):
+    """Display average metrics for a specific data source"""
     st.markdown(f"#### {title}")
     
-    if not data.empty:
-        available_metrics = [m for m in METRICS if m in data.columns]
-        if available_metrics:
-            metrics = data[available_metrics].mean()
-            
+    if metrics is not None:
+        if not metrics.empty:
             fig = go.Figure(data=[
                 go.Bar(
-                    x=available_metrics,
+                    x=metrics.index.tolist(),
                     y=metrics.values,
                     marker_color=color,
                     text=[f"{v:.1f}" for v in metrics.values],
@@ -299,18 +365,15 @@ def display_data_source_metrics(data: pd.DataFrame, title: str, color: str):
     else:
         st.info(f"No {title.lower()} data available")
 
-def display_performance_rating(player_data: pd.DataFrame, all_data: pd.DataFrame):
+def display_performance_rating(player_avg: pd.Series, team_stats: dict):
     """Display overall performance rating"""
     st.markdown("#### Performance Rating")
     
     # Calculate overall performance score
-    available_metrics = [m for m in METRICS if m in player_data.columns and m in all_data.columns]
+    rated_metrics = [m for m in player_avg.index if m in team_stats]
     
-    if available_metrics:
-        player_avg = player_data[available_metrics].mean()
-        all_avg = all_data[available_metrics].mean()
-        
-        performance_score = calculate_performance_score(player_avg, all_data)
+    if rated_metrics:
+        performance_score = team_performance_score(player_avg[rated_metrics], team_stats)
         
         # Display rating
         rating_color = (
@@ -328,15 +391,35 @@ def display_performance_rating(player_data: pd.DataFrame, all_data: pd.DataFrame
         </div>
         """, unsafe_allow_html=True)
 
-def display_metric_trend(player_data: pd.DataFrame, metric: str):
+def centered_moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """Same result as rolling(window, center=True).mean(): NaN where the window is incomplete"""
+    moving_avg = np.full(values.shape, np.nan)
+    if window <= len(values):
+        means = sliding_window_view(values, window).mean(axis=1)
+        moving_avg[window // 2:window // 2 + len(means)] = means
+    return moving_avg
+
+def linear_trend(y: np.ndarray) -> tuple:
+    """Least-squares slope and intercept of y against sessions 1..n, in closed form"""
+    n = len(y)
+    sx = n * (n + 1) / 2
+    sxx = n * (n + 1) * (2 * n + 1) / 6
+    sy = y.sum()
+    sxy = np.arange(1, n + 1) @ y
+    slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+    return slope, (sy - slope * sx) / n
+
+def display_metric_trend(player_data: pd.DataFrame, metric: str, session_numbers: np.ndarray):
     """Display trend for a specific metric"""
     if metric in player_data.columns:
+        # Every series and stat below reads this one array
+        values = player_data[metric].to_numpy(dtype=np.float64)
         fig = go.Figure()
         
         # Add actual values
         fig.add_trace(go.Scatter(
-            x=player_data["Session_Number"],
-            y=player_data[metric],
+            x=session_numbers,
+            y=values,
             mode='lines+markers',
             name='Actual',
             line=dict(color=ThemeConfig.PRIMARY_COLOR, width=2),
@@ -346,24 +429,24 @@ def display_metric_trend(player_data: pd.DataFrame, metric: str):
         # Add moving average
         window = min(5, len(player_data) // 2)
         if window >= 2:
-            player_data[f"{metric}_MA"] = player_data[metric].rolling(window=window, center=True).mean()
+            moving_avg = centered_moving_average(values, window)
             
             fig.add_trace(go.Scatter(
-                x=player_data["Session_Number"],
-                y=player_data[f"{metric}_MA"],
+                x=session_numbers,
+                y=moving_avg,
                 mode='lines',
                 name=f'{window}-Session MA',
                 line=dict(color=ThemeConfig.SECONDARY_COLOR, width=2, dash='dash')
             ))
         
         # Add trend line
+        slope = None
         if len(player_data) > 1:
-            z = np.polyfit(player_data["Session_Number"], player_data[metric].fillna(0), 1)
-            p = np.poly1d(z)
+            slope, intercept = linear_trend(np.nan_to_num(values))
             
             fig.add_trace(go.Scatter(
-                x=player_data["Session_Number"],
-                y=p(player_data["Session_Number"]),
+                x=session_numbers,
+                y=slope * session_numbers + intercept,
                 mode='lines',
                 name='Trend',
                 line=dict(color=ThemeConfig.ACCENT_COLOR, width=2, dash='dot')
@@ -383,8 +466,7 @@ def display_metric_trend(player_data: pd.DataFrame, metric: str):
         st.plotly_chart(fig, use_container_width=True)
         
         # Trend analysis metrics
-        if len(player_data) > 1 and 'z' in locals():
-            slope = z[0]
+        if slope is not None:
             trend_direction = "Improving 📈" if slope > 0 else "Declining 📉" if slope < 0 else "Stable ➡️"
             change_per_session = abs(slope)
             
@@ -394,22 +476,18 @@ def display_metric_trend(player_data: pd.DataFrame, metric: str):
             with col2:
                 st.metric("Change/Session", f"{change_per_session:.3f}")
             with col3:
-                recent_avg = player_data[metric].tail(5).mean()
-                overall_avg = player_data[metric].mean()
+                recent_avg = np.nanmean(values[-5:])
+                overall_avg = np.nanmean(values)
                 recent_vs_avg = ((recent_avg - overall_avg) / overall_avg * 100) if overall_avg > 0 else 0
                 st.metric("Recent vs Average", f"{recent_vs_avg:+.1f}%")
 
-def calculate_player_percentiles(player_data: pd.DataFrame, all_data: pd.DataFrame) -> dict:
+def calculate_player_percentiles(player_avg: pd.Series, team_stats: dict) -> dict:
     """Calculate percentiles for all metrics"""
-    player_avg = player_data[METRICS].mean()
     percentiles = {}
     
-    for metric in METRICS:
-        if metric in player_avg.index and metric in all_data.columns:
-            all_values = all_data[metric].dropna()
-            player_value = player_avg[metric]
-            percentile = (all_values < player_value).sum() / len(all_values) * 100
-            percentiles[metric] = percentile
+    for metric in player_avg.index:
+        if metric in team_stats and len(team_stats[metric]["sorted"]):
+            percentiles[metric] = rank_percentiles(team_stats[metric]["sorted"], player_avg[metric]).item()
     
     return percentiles
 
@@ -430,66 +508,72 @@ def display_percentile_radar(percentiles: dict, player_name: str):
 
 def display_strengths_weaknesses(percentiles: dict):
     """Display strengths and weaknesses analysis"""
-    sorted_metrics = sorted(percentiles.items(), key=lambda x: x[1], reverse=True)
+    # Only the three best and three weakest metrics are shown, so skip the full sort
+    top_metrics = heapq.nlargest(3, percentiles.items(), key=lambda x: x[1])
+    bottom_metrics = heapq.nsmallest(3, percentiles.items(), key=lambda x: x[1])[::-1]
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("#### 💪 Core Strengths")
-        for metric, percentile in sorted_metrics[:3]:
-            if percentile >= 75:
-                badge = "Elite"
-                color = ThemeConfig.SUCCESS_COLOR
-            elif percentile >= 50:
-                badge = "Strong"
-                color = ThemeConfig.SECONDARY_COLOR
-            else:
-                badge = "Average"
-                color = ThemeConfig.ACCENT_COLOR
-            
-            st.markdown(f"""
-            <div style='background-color: {ThemeConfig.CARD_BACKGROUND}; padding: 10px; 
-                        border-radius: 5px; margin: 5px 0; border-left: 3px solid {color};'>
-                <strong>{metric}</strong> - {badge}<br>
-                <span style='color: {color};'>{percentile:.0f}th percentile</span>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("".join(_strength_card_html(metric, percentile)
+                            for metric, percentile in top_metrics), unsafe_allow_html=True)
     
     with col2:
         st.markdown("#### 📈 Development Opportunities")
-        for metric, percentile in sorted_metrics[-3:]:
-            improvement_potential = 100 - percentile
-            
-            st.markdown(f"""
-            <div style='background-color: {ThemeConfig.CARD_BACKGROUND}; padding: 10px; 
-                        border-radius: 5px; margin: 5px 0; border-left: 3px solid {ThemeConfig.WARNING_COLOR};'>
-                <strong>{metric}</strong><br>
-                <span style='color: {ThemeConfig.WARNING_COLOR};'>
-                    {percentile:.0f}th percentile 
-                    ({improvement_potential:.0f}% improvement potential)
-                </span>
-            </div>
-            """, unsafe_allow_html=True)
-
-def display_performance_consistency(player_data: pd.DataFrame):
+        st.markdown("".join(_development_card_html(metric, percentile)
+                            for metric, percentile in bottom_metrics), unsafe_allow_html=True)
+
+def _strength_card_html(metric: str, percentile: float) -> str:
+    """Card for one of the player's top metrics"""
+    if percentile >= 75:
+        badge = "Elite"
+        color = ThemeConfig.SUCCESS_COLOR
+    elif percentile >= 50:
+        badge = "Strong"
+        color = ThemeConfig.SECONDARY_COLOR
+    else:
+        badge = "Average"
+        color = ThemeConfig.ACCENT_COLOR
+    
+    return f"""
+    <div style='background-color: {ThemeConfig.CARD_BACKGROUND}; padding: 10px; 
+                border-radius: 5px; margin: 5px 0; border-left: 3px solid {color};'>
+        <strong>{metric}</strong> - {badge}<br>
+        <span style='color: {color};'>{percentile:.0f}th percentile</span>
+    </div>
+    """
+
+def _development_card_html(metric: str, percentile: float) -> str:
+    """Card for one of the player's weakest metrics"""
+    improvement_potential = 100 - percentile
+    
+    return f"""
+    <div style='background-color: {ThemeConfig.CARD_BACKGROUND}; padding: 10px; 
+                border-radius: 5px; margin: 5px 0; border-left: 3px solid {ThemeConfig.WARNING_COLOR};'>
+        <strong>{metric}</strong><br>
+        <span style='color: {ThemeConfig.WARNING_COLOR};'>
+            {percentile:.0f}th percentile 
+            ({improvement_potential:.0f}% improvement potential)
+        </span>
+    </div>
+    """
+
+def display_performance_consistency(player_data: pd.DataFrame, available_metrics: list):
     """Display performance consistency analysis"""
     st.markdown("#### Performance Consistency")
     
-    consistency_scores = {}
-    available_metrics = [m for m in METRICS if m in player_data.columns]
-    
-    for metric in available_metrics:
-        values = player_data[metric].dropna()
-        if len(values) > 1 and values.mean() > 0:
-            cv = values.std() / values.mean() * 100
-            consistency = 100 - min(cv, 100)
-            consistency_scores[metric] = consistency
-    
-    if consistency_scores:
-        consistency_df = pd.DataFrame(
-            list(consistency_scores.items()),
-            columns=["Metric", "Consistency %"]
-        ).sort_values("Consistency %", ascending=False)
+    # Coefficient of variation for every metric from one aggregate pass
+    stats = player_data[available_metrics].agg(["std", "mean", "count"])
+    means = stats.loc["mean"].to_numpy(dtype=np.float64)
+    valid = (stats.loc["count"].to_numpy() > 1) & (means > 0)
+    cv = stats.loc["std"].to_numpy(dtype=np.float64)[valid] / means[valid] * 100
+    
+    if valid.any():
+        consistency_df = pd.DataFrame({
+            "Metric": np.asarray(available_metrics)[valid],
+            "Consistency %": 100 - np.minimum(cv, 100)
+        }).sort_values("Consistency %", ascending=False)
         
         fig = px.bar(
             consistency_df,
@@ -512,7 +596,8 @@ def display_performance_consistency(player_data: pd.DataFrame):
         
         st.plotly_chart(fig, use_container_width=True)
 
-def generate_player_report(player_data: pd.DataFrame, all_data: pd.DataFrame, 
+def generate_player_report(player_data: pd.DataFrame, available_metrics: list, player_avg: pd.Series,
+                          match_count: int, training_count: int, team_stats: dict,
                           player_name: str, api_key: str, sections: list):
     """Generate comprehensive player report"""
     with st.spinner("Generating report..."):
@@ -524,26 +609,25 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 ## Executive Summary
 
 Total Sessions Analyzed: {len(player_data)}
-- Matches: {len(player_data[player_data['Data Source'] == 'Match'])}
-- Training: {len(player_data[player_data['Data Source'] == 'Training'])}
+- Matches: {match_count}
+- Training: {training_count}
 
 ### Key Performance Indicators
 """
         
         # Add metrics
-        available_metrics = [m for m in METRICS if m in player_data.columns]
-        for metric in available_metrics:
-            avg_value = player_data[metric].mean()
-            if metric in all_data.columns:
-                percentile = (all_data[metric] < avg_value).sum() / len(all_data[metric]) * 100
-                report_content += f"\n- **{metric}**: {avg_value:.2f} ({percentile:.0f}th percentile)"
+        kpi_metrics = [m for m in available_metrics if m in team_stats]
+        kpi_means = player_avg[kpi_metrics].to_numpy(dtype=np.float64)
+        kpi_percentiles = [rank_percentiles(team_stats[m]["sorted"], v).item()
+                           for m, v in zip(kpi_metrics, kpi_means)]
+        report_content += "".join(
+            f"\n- **{metric}**: {avg_value:.2f} ({percentile:.0f}th percentile)"
+            for metric, avg_value, percentile in zip(kpi_metrics, kpi_means, kpi_percentiles)
+        )
         
         # Performance rating
         if available_metrics:
-            performance_score = calculate_performance_score(
-                player_data[available_metrics].mean(), 
-                all_data
-            )
+            performance_score = team_performance_score(player_avg, team_stats)
             report_content += f"\n\n### Overall Performance Score: {performance_score:.0f}/100"
         
         # AI-generated recommendations
@@ -560,7 +644,7 @@ Total Sessions Analyzed: {len(player_data)}
             4. Development priorities
             """
             
-            recommendations = get_ai_coach_insights("Player Report Recommendations", report_summary, api_key)
+            recommendations = "".join(get_ai_coach_insights("Player Report Recommendations", report_summary, api_key))
             report_content += f"\n\n## AI Coach Recommendations\n\n{recommendations}"
         
         # Create download button
@@ -2,12 +2,13 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+from typing import Dict, Tuple
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
-from core.data_loader import load_data
+from core.data_loader import load_data, file_keys, get_player_names
 from core.constants import METRICS
 from core.theme import ThemeConfig
-from components.metrics import create_metric_card
+from components.metrics import create_metric_card, calculate_metric_stats, rank_percentiles, top_k_indices
 from components.charts import create_distribution_plot, create_plotly_radar
 from components.ai_assistant import display_ai_assistant
 
@@ -49,12 +50,36 @@ def render_daily_training_report(api_key: str, team_config: dict):
         horizontal=True
     )
     
+    # Metric columns and their summaries are resolved once and shared by every view
+    available_metrics = [m for m in METRICS if m in df_daily.columns]
+    session_stats = _session_stats(file_keys({selected_session: TRAINING_FILES[selected_session]}),
+                                   tuple(available_metrics))
+    
     if view_mode == "Session Overview":
-        render_session_overview(df_daily, api_key)
+        render_session_overview(df_daily, available_metrics, api_key)
     elif view_mode == "Individual Performance":
-        render_individual_performance(df_daily, api_key)
+        render_individual_performance(df_daily, available_metrics, session_stats, api_key)
     elif view_mode == "Comparative Analysis":
-        render_comparative_analysis(df_daily, api_key)
+        render_comparative_analysis(df_daily, available_metrics, session_stats, api_key)
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=16)
+def _session_stats(session_items: tuple, metrics: tuple) -> Dict[str, Dict]:
+    """Session metric summaries, keyed on the session file's (name, path, mtime) so reruns skip hashing the frame"""
+    ((_, path, _),) = session_items
+    return calculate_metric_stats(load_data(path), metrics)
+
+def _session_metric_arrays(df_daily: pd.DataFrame, metrics: tuple) -> Tuple[np.ndarray, Dict[str, int]]:
+    """Session metrics as one (rows x metrics) float64 array plus each player's first row in it"""
+    values = df_daily[list(metrics)].to_numpy(dtype=np.float64)
+    names, first_rows = np.unique(df_daily["Player Name"].to_numpy().astype(str), return_index=True)
+    return values, dict(zip(names.tolist(), first_rows.tolist()))
+
+def player_metric_rows(df_daily: pd.DataFrame, available_metrics: list,
+                       players: list) -> Tuple[list, np.ndarray]:
+    """Players present in the session and their (players x metrics) values"""
+    values, player_rows = _session_metric_arrays(df_daily, tuple(available_metrics))
+    present = [player for player in players if player in player_rows]
+    return present, values[[player_rows[player] for player in present]]
 
 def display_session_metrics(df: pd.DataFrame, session_name: str, api_key: str):
     """Display session overview metrics"""
@@ -93,12 +118,11 @@ def display_session_metrics(df: pd.DataFrame, session_name: str, api_key: str):
     
     display_ai_assistant("Daily Training Overview", daily_summary, api_key)
 
-def render_session_overview(df_daily: pd.DataFrame, api_key: str):
+def render_session_overview(df_daily: pd.DataFrame, available_metrics: list, api_key: str):
     """Render session overview"""
     st.markdown("### Session Overview")
     
     # Metric distribution
-    available_metrics = [m for m in METRICS if m in df_daily.columns]
     selected_metric = st.selectbox(
         "Select metric to analyze:",
         available_metrics,
@@ -112,39 +136,45 @@ def render_session_overview(df_daily: pd.DataFrame, api_key: str):
         st.plotly_chart(fig, use_container_width=True)
     
     # Player rankings for the session
-    display_session_rankings(df_daily)
+    display_session_rankings(df_daily, available_metrics)
 
-def render_individual_performance(df_daily: pd.DataFrame, api_key: str):
+def render_individual_performance(df_daily: pd.DataFrame, available_metrics: list,
+                                  session_stats: dict, api_key: str):
     """Render individual performance for daily training"""
     st.markdown("### Individual Performance Analysis")
     
-    available_players = sorted(df_daily["Player Name"].unique())
+    available_players = get_player_names(df_daily)
     selected_player = st.selectbox(
         "Select Player:",
         available_players,
         key="daily_individual_player"
     )
     
-    player_data = df_daily[df_daily["Player Name"] == selected_player]
+    present, player_matrix = player_metric_rows(df_daily, available_metrics, [selected_player])
     
-    if not player_data.empty:
-        player_data = player_data.iloc[0]
+    if present:
+        # The player's first row as one flat vector aligned with available_metrics
+        player_values = player_matrix[0]
         
         # Display player metrics
-        display_individual_metrics(player_data, df_daily, selected_player)
+        display_individual_metrics(player_values, available_metrics, session_stats, selected_player)
+        
+        # Percentiles are computed once and shared by the radar and the insights
+        percentiles = calculate_session_percentiles(player_values, session_stats, available_metrics, len(df_daily))
         
         # Percentile rankings
-        display_percentile_rankings(player_data, df_daily, selected_player, api_key)
+        display_percentile_rankings(player_values, available_metrics, percentiles, selected_player, api_key)
         
         # Performance insights
-        display_performance_insights(player_data, df_daily, selected_player)
+        display_performance_insights(available_metrics, percentiles)
 
-def render_comparative_analysis(df_daily: pd.DataFrame, api_key: str):
+def render_comparative_analysis(df_daily: pd.DataFrame, available_metrics: list,
+                                session_stats: dict, api_key: str):
     """Render comparative analysis for daily training"""
     st.markdown("### Comparative Analysis")
     
     # Player selection
-    available_players = sorted(df_daily["Player Name"].unique())
+    available_players = get_player_names(df_daily)
     players = st.multiselect(
         "Select 2-4 players to compare:",
         available_players,
@@ -160,17 +190,20 @@ def render_comparative_analysis(df_daily: pd.DataFrame, api_key: str):
     comparison_df = df_daily[df_daily["Player Name"].isin(players)]
     
     # Metric comparison
-    display_metric_comparison(comparison_df, players)
+    display_metric_comparison(comparison_df, available_metrics, players)
     
     # Radar comparison
-    display_radar_comparison(comparison_df, df_daily, players)
+    display_radar_comparison(df_daily, available_metrics, session_stats, players)
     
     # AI Assistant for Comparison
-    comparison_summary = create_comparison_summary(comparison_df, players)
-    display_ai_assistant("Player Comparison Analysis", comparison_summary, api_key)
+    display_ai_assistant(
+        "Player Comparison Analysis",
+        lambda: create_comparison_summary(df_daily, available_metrics, players),
+        api_key
+    )
     
     # Comparison table
-    display_comparison_table(comparison_df, df_daily, players)
+    display_comparison_table(comparison_df, available_metrics, session_stats, players)
 
 # Helper functions for daily training
 
@@ -184,54 +217,54 @@ def calculate_session_metrics(df: pd.DataFrame) -> dict:
     }
     return metrics
 
-def display_session_rankings(df: pd.DataFrame):
+def display_session_rankings(df: pd.DataFrame, available_metrics: list):
     """Display session player rankings"""
     st.markdown("### Session Rankings")
     
-    ranking_data = df.copy()
-    available_metrics = [m for m in METRICS if m in ranking_data.columns]
-    
     if available_metrics:
-        ranking_data["Overall Score"] = ranking_data[available_metrics].mean(axis=1)
-        ranking_data = ranking_data.sort_values("Overall Score", ascending=False)
+        # Rank on a score array instead of copying the session frame to add a column
+        scores = df[available_metrics].mean(axis=1).to_numpy()
+        podium = top_k_indices(scores, 3)
         
         # Top performers
         col1, col2, col3 = st.columns(3)
         
-        top_3 = ranking_data.head(3)
+        top_names = df["Player Name"].to_numpy()[podium]
         medals = ["🥇", "🥈", "🥉"]
         
-        for i, (col, (_, player)) in enumerate(zip([col1, col2, col3], top_3.iterrows())):
+        for i, (col, name, score) in enumerate(zip([col1, col2, col3], top_names, scores[podium])):
             with col:
                 st.markdown(f"""
                 <div style='text-align: center; background-color: {ThemeConfig.CARD_BACKGROUND}; 
                             padding: 20px; border-radius: 10px;'>
                     <h1>{medals[i]}</h1>
-                    <h4>{player['Player Name']}</h4>
-                    <p>Score: {player['Overall Score']:.2f}</p>
+                    <h4>{name}</h4>
+                    <p>Score: {score:.2f}</p>
                 </div>
                 """, unsafe_allow_html=True)
         
-        # Full ranking table
-        with st.expander("View Complete Rankings"):
-            display_cols = ["Player Name"] + available_metrics + ["Overall Score"]
+        # Full ranking table; expander bodies always execute, so a toggle gates the build
+        if st.toggle("View Complete Rankings", key="daily_show_rankings"):
+            order = np.argsort(-scores, kind="stable")
+            ranking_table = df.iloc[order][["Player Name"] + available_metrics].assign(
+                **{"Overall Score": scores[order]}
+            )
             st.dataframe(
-                ranking_data[display_cols].reset_index(drop=True),
+                ranking_table.reset_index(drop=True),
                 use_container_width=True
             )
 
-def display_individual_metrics(player_data: pd.Series, df: pd.DataFrame, player_name: str):
+def display_individual_metrics(player_values: np.ndarray, available_metrics: list,
+                               session_stats: dict, player_name: str):
     """Display individual player metrics"""
     st.markdown(f"#### {player_name} - Performance Metrics")
     
     # Create metric cards in grid
     cols = st.columns(4)
-    available_metrics = [m for m in METRICS if m in player_data.index]
     
-    for i, metric in enumerate(available_metrics):
+    for i, (metric, value) in enumerate(zip(available_metrics, player_values)):
         with cols[i % 4]:
-            value = player_data[metric]
-            avg_value = df[metric].mean()
+            avg_value = session_stats[metric]["mean"]
             delta = ((value - avg_value) / avg_value * 100) if avg_value > 0 else 0
             
             st.markdown(create_metric_card(
@@ -240,19 +273,21 @@ def display_individual_metrics(player_data: pd.Series, df: pd.DataFrame, player_
                 delta
             ), unsafe_allow_html=True)
 
-def display_percentile_rankings(player_data: pd.Series, df: pd.DataFrame, 
+def calculate_session_percentiles(player_values: np.ndarray, session_stats: dict, metrics: list,
+                                  session_rows: int) -> np.ndarray:
+    """Percentiles of player values (last axis = metrics) against the session's sorted columns"""
+    if not metrics:
+        return np.zeros(player_values.shape[:-1] + (0,))
+    # Shares are of all session rows, so rows missing a metric still count in the denominator
+    return np.stack([rank_percentiles(session_stats[metric]["sorted"], player_values[..., j], session_rows)
+                     for j, metric in enumerate(metrics)], axis=-1)
+
+def display_percentile_rankings(player_values: np.ndarray, available_metrics: list, percentiles: np.ndarray,
                                player_name: str, api_key: str):
     """Display percentile rankings for individual player"""
     st.markdown("#### Percentile Rankings")
     
-    available_metrics = [m for m in METRICS if m in player_data.index and m in df.columns]
-    percentile_data = []
-    
-    for metric in available_metrics:
-        all_values = df[metric]
-        player_value = player_data[metric]
-        percentile = (all_values < player_value).sum() / len(all_values) * 100
-        percentile_data.append(percentile)
+    percentile_data = percentiles.tolist()
     
     if percentile_data:
         # Create radar chart
@@ -265,33 +300,26 @@ def display_percentile_rankings(player_data: pd.Series, df: pd.DataFrame,
         
         st.plotly_chart(fig, use_container_width=True)
     
-    # AI Assistant
-    individual_summary = f"""
+    # AI Assistant; the summary is only formatted once insights are requested
+    def build_individual_summary() -> str:
+        return f"""
     Individual Performance Analysis: {player_name}
     
     Session Metrics:
-    {chr(10).join([f"- {metric}: {player_data[metric]:.2f} ({percentile_data[i]:.0f}th percentile)" 
+    {chr(10).join([f"- {metric}: {player_values[i]:.2f} ({percentile_data[i]:.0f}th percentile)" 
                    for i, metric in enumerate(available_metrics)])}
     
     Strengths: {', '.join([available_metrics[i] for i, p in enumerate(percentile_data) if p >= 75])}
     Areas to monitor: {', '.join([available_metrics[i] for i, p in enumerate(percentile_data) if p < 50])}
     """
     
-    display_ai_assistant("Individual Session Performance", individual_summary, api_key)
+    display_ai_assistant("Individual Session Performance", build_individual_summary, api_key)
 
-def display_performance_insights(player_data: pd.Series, df: pd.DataFrame, player_name: str):
+def display_performance_insights(available_metrics: list, percentiles: np.ndarray):
     """Display performance insights"""
     st.markdown("#### Performance Insights")
     
-    available_metrics = [m for m in METRICS if m in player_data.index and m in df.columns]
-    
-    # Calculate percentiles
-    metric_percentiles = {}
-    for metric in available_metrics:
-        all_values = df[metric]
-        player_value = player_data[metric]
-        percentile = (all_values < player_value).sum() / len(all_values) * 100
-        metric_percentiles[metric] = percentile
+    metric_percentiles = dict(zip(available_metrics, percentiles.tolist()))
     
     # Find strengths and areas for improvement
     strengths = sorted(metric_percentiles.items(), key=lambda x: x[1], reverse=True)[:3]
@@ -309,11 +337,10 @@ def display_performance_insights(player_data: pd.Series, df: pd.DataFrame, playe
         for metric, percentile in improvements:
             st.markdown(f"- {metric}: {percentile:.0f}th percentile")
 
-def display_metric_comparison(comparison_df: pd.DataFrame, players: list):
+def display_metric_comparison(comparison_df: pd.DataFrame, available_metrics: list, players: list):
     """Display metric comparison between players"""
     st.markdown("#### Metric Comparison")
     
-    available_metrics = [m for m in METRICS if m in comparison_df.columns]
     metrics_for_comparison = st.multiselect(
         "Select metrics to compare:",
         available_metrics,
@@ -322,26 +349,26 @@ def display_metric_comparison(comparison_df: pd.DataFrame, players: list):
     )
     
     if metrics_for_comparison:
-        # Reshape data for plotting
-        plot_data = comparison_df[["Player Name"] + metrics_for_comparison].melt(
-            id_vars="Player Name",
-            var_name="Metric",
-            value_name="Value"
-        )
+        # Aggregate to one row per player first; each player becomes one trace of precomputed bars
+        player_means = comparison_df.groupby("Player Name", observed=True)[metrics_for_comparison].mean()
+        colors = [ThemeConfig.PRIMARY_COLOR, ThemeConfig.SECONDARY_COLOR,
+                  ThemeConfig.ACCENT_COLOR, ThemeConfig.SUCCESS_COLOR]
         
-        fig = px.bar(
-            plot_data,
-            x="Metric",
-            y="Value",
-            color="Player Name",
+        fig = go.Figure([
+            go.Bar(
+                name=player,
+                x=metrics_for_comparison,
+                y=player_means.loc[player].to_numpy(),
+                marker_color=colors[i % len(colors)]
+            )
+            for i, player in enumerate(p for p in players if p in player_means.index)
+        ])
+        
+        fig.update_layout(
             barmode="group",
             title="Player Metric Comparison",
             height=500,
-            color_discrete_sequence=[ThemeConfig.PRIMARY_COLOR, ThemeConfig.SECONDARY_COLOR, 
-                                   ThemeConfig.ACCENT_COLOR, ThemeConfig.SUCCESS_COLOR]
-        )
-        
-        fig.update_layout(
+            legend_title_text="Player Name",
             plot_bgcolor=ThemeConfig.CARD_BACKGROUND,
             paper_bgcolor=ThemeConfig.BACKGROUND_COLOR,
             font=dict(color=ThemeConfig.TEXT_COLOR),
@@ -350,40 +377,29 @@ def display_metric_comparison(comparison_df: pd.DataFrame, players: list):
         
         st.plotly_chart(fig, use_container_width=True)
 
-def display_radar_comparison(comparison_df: pd.DataFrame, full_df: pd.DataFrame, players: list):
+def display_radar_comparison(df_daily: pd.DataFrame, available_metrics: list,
+                             session_stats: dict, players: list):
     """Display radar comparison between players"""
     st.markdown("#### Multi-Player Radar Analysis")
     
-    available_metrics = [m for m in METRICS if m in comparison_df.columns and m in full_df.columns]
-    
-    # Calculate percentiles
-    percentile_data = []
-    for player in players:
-        player_row = comparison_df[comparison_df["Player Name"] == player]
-        if not player_row.empty:
-            player_data = player_row.iloc[0]
-            player_percentiles = []
-            for metric in available_metrics:
-                all_values = full_df[metric]
-                player_value = player_data[metric]
-                percentile = (all_values < player_value).sum() / len(all_values) * 100
-                player_percentiles.append(percentile)
-            percentile_data.append(player_percentiles)
+    # (players x metrics) percentiles, one searchsorted per metric against the sorted session column
+    ranked_players, player_values = player_metric_rows(df_daily, available_metrics, players)
     
-    if percentile_data:
+    if ranked_players and available_metrics:
+        percentile_data = calculate_session_percentiles(player_values, session_stats, available_metrics,
+                                                        len(df_daily)).tolist()
+        
         fig = create_plotly_radar(
             percentile_data,
             available_metrics,
             "Player Comparison - Percentile Rankings",
-            players
+            ranked_players
         )
         
         st.plotly_chart(fig, use_container_width=True)
 
-def create_comparison_summary(df: pd.DataFrame, players: list) -> str:
+def create_comparison_summary(df: pd.DataFrame, available_metrics: list, players: list) -> str:
     """Create comparison summary for AI assistant"""
-    available_metrics = [m for m in METRICS if m in df.columns]
-    
     summary = f"""
     Player Comparison Analysis:
     Players: {', '.join(players)}
@@ -391,32 +407,33 @@ def create_comparison_summary(df: pd.DataFrame, players: list) -> str:
     Key Observations:
     """
     
-    for metric in available_metrics[:3]:
-        if metric in df.columns:
-            metric_values = []
-            for player in players:
-                player_data = df[df['Player Name'] == player]
-                if not player_data.empty:
-                    value = player_data[metric].iloc[0]
-                    metric_values.append(f"{player} ({value:.1f})")
-            
-            if metric_values:
-                summary += f"\n- {metric}: {', '.join(metric_values)}"
+    present_players, player_values = player_metric_rows(df, available_metrics, players)
+    
+    for j, metric in enumerate(available_metrics[:3]):
+        metric_values = [f"{player} ({value:.1f})"
+                         for player, value in zip(present_players, player_values[:, j])]
+        
+        if metric_values:
+            summary += f"\n- {metric}: {', '.join(metric_values)}"
     
     summary += "\n\nConsider: Position-specific requirements, tactical roles, individual development plans"
     
     return summary
 
-def display_comparison_table(comparison_df: pd.DataFrame, full_df: pd.DataFrame, players: list):
+def display_comparison_table(comparison_df: pd.DataFrame, available_metrics: list,
+                             session_stats: dict, players: list):
     """Display detailed comparison table"""
     st.markdown("#### Detailed Comparison")
     
-    available_metrics = [m for m in METRICS if m in comparison_df.columns]
+    # The per-cell gradient styling is only built when the table is requested
+    if not st.toggle("Show comparison table", key="daily_show_comparison_table"):
+        return
+    
     comparison_display = comparison_df[["Player Name"] + available_metrics].set_index("Player Name")
     
     # Add averages
     if available_metrics:
-        comparison_display.loc["Team Average"] = full_df[available_metrics].mean()
+        comparison_display.loc["Team Average"] = [session_stats[m]["mean"] for m in available_metrics]
     
     st.dataframe(
         comparison_display.style.background_gradient(cmap='RdYlGn', axis=0),
@@ -2,7 +2,7 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from core.data_loader import load_data
+from core.data_loader import load_data, file_keys, concat_frames, get_player_names
 from core.constants import METRICS
 from core.theme import ThemeConfig
 from components.metrics import create_metric_card, calculate_load_score
@@ -35,21 +35,11 @@ def render_weekly_training_report(api_key: str, team_config: dict):
         return
     
     # Load data with proper ordering
-    training_data = []
-    session_order = {session: idx for idx, session in enumerate(available_sessions)}
-    
-    for session in selected_sessions:
-        df_temp = load_data(TRAINING_FILES[session])
-        if not df_temp.empty:
-            df_temp["Session"] = session
-            df_temp["Session_Order"] = session_order[session]
-            training_data.append(df_temp)
+    weekly_df = load_weekly_data(TRAINING_FILES, selected_sessions)
     
-    if not training_data:
+    if weekly_df.empty:
         st.warning("No data available for selected sessions.")
         return
-        
-    weekly_df = pd.concat(training_data, ignore_index=True)
     
     # View mode selection
     view_mode = st.sidebar.radio(
@@ -65,7 +55,7 @@ def render_weekly_training_report(api_key: str, team_config: dict):
     elif view_mode == "Session Comparison":
         render_session_comparison(weekly_df, api_key)
     elif view_mode == "Load Management":
-        render_load_management(weekly_df, api_key)
+        render_load_management(load_weekly_data(TRAINING_FILES, selected_sessions, with_load_score=True), api_key)
 
 def render_team_overview(weekly_df: pd.DataFrame, api_key: str):
     """Render team overview for weekly training"""
@@ -94,8 +84,11 @@ def render_team_overview(weekly_df: pd.DataFrame, api_key: str):
                    unsafe_allow_html=True)
     
     # AI Assistant
-    team_summary = create_team_summary(weekly_df, metrics_data)
-    display_ai_assistant("Weekly Team Training Analysis", team_summary, api_key)
+    display_ai_assistant(
+        "Weekly Team Training Analysis",
+        lambda: create_team_summary(weekly_df, metrics_data),
+        api_key
+    )
     
     # Training load distribution
     display_load_distribution(weekly_df)
@@ -112,7 +105,7 @@ def render_individual_analysis(weekly_df: pd.DataFrame, api_key: str):
         return
     
     # Player selection
-    available_players = sorted(weekly_df["Player Name"].unique())
+    available_players = get_player_names(weekly_df)
     selected_player = st.sidebar.selectbox(
         "Select Player",
         available_players,
@@ -152,26 +145,29 @@ def render_session_comparison(weekly_df: pd.DataFrame, api_key: str):
     display_player_participation(weekly_df)
     
     # AI Assistant
-    session_summary = create_session_comparison_summary(weekly_df)
-    display_ai_assistant("Training Session Comparison", session_summary, api_key)
+    display_ai_assistant(
+        "Training Session Comparison",
+        lambda: create_session_comparison_summary(weekly_df),
+        api_key
+    )
 
 def render_load_management(weekly_df: pd.DataFrame, api_key: str):
-    """Render load management analysis"""
+    """Render load management analysis (weekly_df carries the cached Load Score column)"""
     st.markdown("### Load Management & Recovery")
     
     if weekly_df.empty:
         st.warning("No data available for load management analysis.")
         return
     
-    # Calculate load metrics
-    weekly_df["Load Score"] = calculate_load_score(weekly_df)
-    
     # Player load status
     display_load_status(weekly_df)
     
     # AI Assistant
-    load_summary = create_load_management_summary(weekly_df)
-    display_ai_assistant("Load Management Analysis", load_summary, api_key)
+    display_ai_assistant(
+        "Load Management Analysis",
+        lambda: create_load_management_summary(weekly_df),
+        api_key
+    )
     
     # Detailed player load table
     display_detailed_load_analysis(weekly_df)
@@ -181,6 +177,41 @@ def render_load_management(weekly_df: pd.DataFrame, api_key: str):
 
 # Helper functions for weekly training
 
+def load_weekly_data(training_files: dict, selected_sessions: list,
+                     with_load_score: bool = False) -> pd.DataFrame:
+    """Selected sessions in one frame tagged with Session and Session_Order"""
+    session_order = {session: idx for idx, session in enumerate(training_files)}
+    session_items = file_keys({session: training_files[session] for session in selected_sessions})
+    session_orders = tuple(session_order[session] for session in selected_sessions)
+    if with_load_score:
+        return _load_weekly_data_with_load_score(session_items, session_orders)
+    return _load_weekly_data(session_items, session_orders)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_weekly_data(session_items: tuple, session_orders: tuple) -> pd.DataFrame:
+    """Cached body of load_weekly_data, keyed on (name, path, mtime) of the selected sessions"""
+    # Session is categorical in configured order, so pivots and groupbys run on codes
+    session_dtype = pd.CategoricalDtype(
+        [session for _, session in sorted(zip(session_orders, (item[0] for item in session_items)))],
+        ordered=True
+    )
+    training_data = []
+    for (session, path, _), order in zip(session_items, session_orders):
+        df_temp = load_data(path)
+        if not df_temp.empty:
+            session_col = pd.Categorical([session] * len(df_temp), dtype=session_dtype)
+            training_data.append(df_temp.assign(Session=session_col, Session_Order=order))
+    
+    return concat_frames(training_data)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_weekly_data_with_load_score(session_items: tuple, session_orders: tuple) -> pd.DataFrame:
+    """Weekly frame with the Load Score column, cached on the same keys as _load_weekly_data"""
+    weekly_df = _load_weekly_data(session_items, session_orders)
+    if weekly_df.empty:
+        return weekly_df
+    return weekly_df.assign(**{"Load Score": calculate_load_score(weekly_df)})
+
 def calculate_team_metrics(df: pd.DataFrame) -> dict:
     """Calculate team-level metrics"""
     metrics = {
@@ -216,12 +247,11 @@ def display_load_distribution(df: pd.DataFrame):
     st.markdown("#### Training Load Distribution")
     
     if "Session" in df.columns and "Total Distance" in df.columns:
-        pivot_df = df.pivot_table(
-            values="Total Distance",
-            index="Player Name",
-            columns="Session",
-            aggfunc="mean"
-        ).fillna(0)
+        # groupby/unstack on the categorical codes; observed=True skips unused player-session pairs
+        pivot_df = (df.groupby(["Player Name", "Session"], observed=True)["Total Distance"]
+                    .mean()
+                    .dropna()
+                    .unstack(fill_value=0))
         
         if not pivot_df.empty:
             fig = create_heatmap(pivot_df, "Player Load Heatmap")
@@ -239,7 +269,8 @@ def display_player_rankings(df: pd.DataFrame):
     )
     
     if ranking_metric in df.columns:
-        fig = create_performance_bar_chart(df, ranking_metric, f"Top 10 Players - {ranking_metric}")
+        fig = create_performance_bar_chart(df, ranking_metric, f"Top 10 Players - {ranking_metric}",
+                                           top_n=10)
         st.plotly_chart(fig, use_container_width=True)
 
 # Additional helper functions would continue here...
@@ -1,4 +1,6 @@
 # teams_config.py
+import sys
+from types import MappingProxyType
 
 # Team 1: SSA Swarm USL2 2025
 SSA_SWARM_USL2 = {
@@ -99,3 +101,13 @@ TEAMS_CONFIG = {
     "SSA Swarm GA U19": SSA_GIRLS_ACADEMY,
     # Add more teams here...
 }
+
+def _freeze(config):
+    """Read-only view of a nested config dict with interned string keys"""
+    return MappingProxyType({
+        sys.intern(key) if isinstance(key, str) else key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    })
+
+# Config is read on every rerun and feeds cache keys; freezing it keeps pages from mutating it
+TEAMS_CONFIG = _freeze(TEAMS_CONFIG)
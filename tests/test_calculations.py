@@ -0,0 +1,55 @@
+"""Tests for calculation utilities"""
+import numpy as np
+import pandas as pd
+
+from components import metrics
+from utils.calculations import calculate_composite_score, calculate_percentile_values, calculate_z_scores
+
+
+def test_calculate_percentile_values_ranks_against_full_frame():
+    full_df = pd.DataFrame({"Total Distance": [4.0, 5.0, 6.0, np.nan]})
+    selected_df = pd.DataFrame({"Player Name": ["A", "B"], "Total Distance": [6.0, np.nan]})
+
+    result = calculate_percentile_values(selected_df, full_df, ["Total Distance"])
+
+    assert result["Total Distance"].tolist() == [200 / 3, 0.0]
+    assert metrics.calculate_percentile_values is calculate_percentile_values
+
+
+def test_calculate_percentile_values_does_not_alias_passthrough_columns():
+    selected_df = pd.DataFrame({"Player Name": ["A", "B"], "Max Speed": [30.0, 28.0],
+                                "Total Distance": [5.0, 6.0]})
+
+    result = calculate_percentile_values(selected_df, selected_df, ["Total Distance"])
+    result.loc[0, "Max Speed"] = 0.0
+
+    assert selected_df["Max Speed"].tolist() == [30.0, 28.0]
+
+
+def test_calculate_z_scores_does_not_alias_passthrough_columns():
+    df = pd.DataFrame({"Player Name": ["A", "B", "C"], "Max Speed": [30.0, 28.0, 29.0],
+                       "Total Distance": [4.0, 5.0, 6.0]})
+
+    result = calculate_z_scores(df, ["Total Distance"])
+    result.loc[0, "Max Speed"] = 0.0
+
+    assert result["Total Distance"].dtype == np.float32
+    assert np.allclose(result["Total Distance"], [-1.0, 0.0, 1.0])
+    assert df["Max Speed"].tolist() == [30.0, 28.0, 29.0]
+
+
+def test_calculate_composite_score_skips_missing_metrics():
+    data = pd.Series({"Total Distance": 80.0, "Max Speed": np.nan, "Accelerations": 60.0})
+
+    score = calculate_composite_score(data, {"Total Distance": 0.5, "Max Speed": 0.3, "Hidden": 0.1,
+                                             "Accelerations": 0.2})
+
+    assert np.isclose(score, (80.0 * 0.5 + 60.0 * 0.2) / 0.7)
+
+
+def test_calculate_composite_score_uses_first_of_duplicated_metrics():
+    data = pd.Series([80.0, 10.0, 60.0], index=["Total Distance", "Total Distance", "Accelerations"])
+
+    score = calculate_composite_score(data, {"Total Distance": 0.5, "Accelerations": 0.5})
+
+    assert np.isclose(score, 70.0)
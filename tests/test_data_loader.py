@@ -0,0 +1,39 @@
+"""Tests for data loading helpers"""
+import pandas as pd
+
+from core.data_loader import concat_frames
+
+
+def _frame(dtype: pd.CategoricalDtype, value: str) -> pd.DataFrame:
+    return pd.DataFrame({"Session": pd.Categorical([value], dtype=dtype)})
+
+
+def test_concat_frames_keeps_shared_ordered_dtype():
+    dtype = pd.CategoricalDtype(["5.12 Training", "5.13 Training", "5.15 Training"], ordered=True)
+
+    combined = concat_frames([_frame(dtype, "5.13 Training"), _frame(dtype, "5.12 Training")])
+
+    assert combined["Session"].dtype == dtype
+    assert combined["Session"].dtype.ordered
+    assert combined["Session"].max() == "5.13 Training"
+
+
+def test_concat_frames_merges_compatible_ordered_dtypes():
+    narrow = pd.CategoricalDtype(["a", "c"], ordered=True)
+    wide = pd.CategoricalDtype(["a", "b", "c"], ordered=True)
+
+    combined = concat_frames([_frame(narrow, "c"), _frame(wide, "b")])
+
+    assert combined["Session"].dtype == wide
+    assert combined["Session"].tolist() == ["c", "b"]
+
+
+def test_concat_frames_unions_conflicting_orders_unordered():
+    forward = pd.CategoricalDtype(["a", "c"], ordered=True)
+    backward = pd.CategoricalDtype(["c", "a"], ordered=True)
+
+    combined = concat_frames([_frame(forward, "a"), _frame(backward, "c")])
+
+    assert isinstance(combined["Session"].dtype, pd.CategoricalDtype)
+    assert not combined["Session"].dtype.ordered
+    assert combined["Session"].tolist() == ["a", "c"]
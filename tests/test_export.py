@@ -0,0 +1,78 @@
+"""Tests for export utilities"""
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.export import create_backup_data, export_to_excel, generate_csv_export, read_backup_data
+
+
+def _read_sheet(data: bytes, sheet_name: str) -> list:
+    openpyxl = pytest.importorskip("openpyxl")
+    worksheet = openpyxl.load_workbook(BytesIO(data))[sheet_name]
+    return [list(row) for row in worksheet.iter_rows(values_only=True)]
+
+
+def test_export_to_excel_writes_missing_and_infinite_values():
+    pytest.importorskip("xlsxwriter")
+    df = pd.DataFrame({
+        "Player Name": pd.Categorical(["A", "B", "C"]),
+        "Total Distance": [1.5, np.nan, np.inf],
+        "Max Speed": [-np.inf, 30.25, 28.0],
+        "Date": pd.to_datetime(["2025-05-17", None, "2025-05-21"]),
+    })
+
+    rows = _read_sheet(export_to_excel({"Stats": df}, "stats.xlsx"), "Stats")
+
+    assert rows[0] == ["Player Name", "Total Distance", "Max Speed", "Date"]
+    assert rows[1][:3] == ["A", 1.5, "-inf"]
+    assert rows[2][:3] == ["B", None, 30.25]
+    assert rows[2][3] is None
+    assert rows[3][:3] == ["C", "inf", 28.0]
+    assert rows[3][3] == pd.Timestamp("2025-05-21")
+
+
+def test_create_backup_data_round_trips_mixed_type_columns():
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        "Player Name": pd.Categorical(["A", "B", "C"]),
+        "Total Distance": np.array([5.2, 6.1, np.nan], dtype=np.float32),
+        "Notes": [17, "left early", None],
+    })
+
+    header, restored = read_backup_data(create_backup_data(df, {"team": "SSA Swarm USL2"}))
+
+    assert header["format"] == "parquet"
+    assert header["metadata"]["team"] == "SSA Swarm USL2"
+    assert header["metadata"]["total_records"] == 3
+    assert header["dtypes"]["Notes"] == "object"
+    assert restored["Notes"].tolist()[:2] == ["17", "left early"]
+    assert pd.isna(restored["Notes"].iloc[2])
+    assert restored["Player Name"].dtype == df["Player Name"].dtype
+    assert restored["Total Distance"].dtype == np.float32
+    assert df["Notes"].tolist()[0] == 17
+
+
+def test_export_to_excel_writes_numpy_scalar_types():
+    pytest.importorskip("xlsxwriter")
+    df = pd.DataFrame({
+        "Sprints": np.array([3, 12], dtype=np.int64),
+        "Top Speed": np.array([31.5, np.inf], dtype=np.float32),
+        "Starter": [True, False],
+        "Minutes": pd.array([90, None], dtype="Int64"),
+    })
+
+    rows = _read_sheet(export_to_excel({"Stats": df}, "stats.xlsx"), "Stats")
+
+    assert rows[1] == [3, 31.5, True, 90]
+    assert rows[2] == [12, "inf", False, None]
+
+
+def test_generate_csv_export_rounds_floats_to_two_decimals():
+    df = pd.DataFrame({"Player Name": ["A", "B"], "Total Distance": [5.236, np.nan], "No of Sprints": [12, 7]})
+
+    csv = generate_csv_export(df, "stats.csv")
+
+    assert csv.splitlines() == ["Player Name,Total Distance,No of Sprints", "A,5.24,12", "B,,7"]
+    assert df["Total Distance"].iloc[0] == 5.236
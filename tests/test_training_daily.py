@@ -0,0 +1,22 @@
+"""Tests for the daily training report helpers"""
+import numpy as np
+import pandas as pd
+
+from components.metrics import calculate_metric_stats
+from pages.training_daily import calculate_session_percentiles
+
+
+def test_session_percentiles_count_missing_rows_in_denominator():
+    df = pd.DataFrame({"Total Distance": [4.0, 5.0, np.nan, 6.0],
+                       "Max Speed": [28.0, 29.0, 30.0, 31.0]})
+    metrics = ["Total Distance", "Max Speed"]
+    session_stats = calculate_metric_stats(df, tuple(metrics))
+
+    percentiles = calculate_session_percentiles(np.array([[6.0, 31.0], [np.nan, 30.0]]),
+                                                session_stats, metrics, len(df))
+
+    # Same strictly-below share over every session row as (df[metric] < value).sum() / len(df)
+    expected = [[(df[m] < v).sum() / len(df) * 100 for m, v in zip(metrics, row)]
+                for row in ([6.0, 31.0], [np.nan, 30.0])]
+    assert np.allclose(percentiles, expected)
+    assert percentiles[0, 0] == 50.0
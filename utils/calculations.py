@@ -7,24 +7,27 @@ from core.constants import METRICS, PERFORMANCE_WEIGHTS
 def calculate_percentile_values(selected_df: pd.DataFrame, full_df: pd.DataFrame, 
                                metrics: List[str]) -> pd.DataFrame:
     """Calculate percentile values for radar charts"""
-    percentile_df = selected_df.copy()
+    percentiles = {}
     for metric in metrics:
         if metric in full_df.columns:
-            all_values = full_df[metric].dropna()
+            all_values = np.sort(full_df[metric].dropna().to_numpy(dtype=np.float64))
             if len(all_values) > 0:
-                percentile_df[metric] = selected_df[metric].apply(
-                    lambda val: (all_values < val).sum() / len(all_values) * 100 
-                    if pd.notna(val) else 0
-                )
-    return percentile_df
+                # Strictly-smaller counts for every selected row in one searchsorted call
+                values = selected_df[metric].to_numpy(dtype=np.float64)
+                ranks = np.searchsorted(all_values, values, side='left')
+                percentiles[metric] = np.where(np.isnan(values), 0.0, ranks * (100.0 / len(all_values)))
+    
+    return pd.DataFrame({col: percentiles.get(col, selected_df[col]) for col in selected_df.columns},
+                        index=selected_df.index, copy=True)
 
 def calculate_growth_rate(data: pd.Series) -> float:
     """Calculate growth rate from time series data"""
-    if len(data) < 2:
+    values = np.asarray(data, dtype=np.float64)
+    if len(values) < 2:
         return 0.0
     
-    first_value = data.iloc[0]
-    last_value = data.iloc[-1]
+    first_value = values[0]
+    last_value = values[-1]
     
     if first_value == 0:
         return 100.0 if last_value > 0 else 0.0
@@ -33,44 +36,59 @@ def calculate_growth_rate(data: pd.Series) -> float:
 
 def calculate_consistency_score(data: pd.Series) -> float:
     """Calculate consistency score (lower CV = more consistent)"""
-    if len(data) < 2 or data.mean() == 0:
+    values = np.asarray(data, dtype=np.float64)
+    if len(values) < 2:
+        return 100.0
+    
+    # Same NaN-skipping, ddof=1 statistics as the pandas reductions, straight on the array
+    values = values[~np.isnan(values)]
+    mean = values.mean() if len(values) else np.nan
+    if mean == 0:
         return 100.0
     
-    cv = (data.std() / data.mean()) * 100
+    std = values.std(ddof=1) if len(values) > 1 else np.nan
+    cv = (std / mean) * 100
     return max(0, 100 - cv)
 
 def calculate_z_scores(df: pd.DataFrame, metrics: List[str]) -> pd.DataFrame:
     """Calculate z-scores for normalization"""
-    z_scores = df.copy()
-    for metric in metrics:
-        if metric in df.columns:
-            mean = df[metric].mean()
-            std = df[metric].std()
-            if std > 0:
-                z_scores[metric] = (df[metric] - mean) / std
-            else:
-                z_scores[metric] = 0
-    return z_scores
+    present = [metric for metric in metrics if metric in df.columns]
+    if not present:
+        return df.copy()
+    
+    # Column means/stds in one float64 reduction each, then one broadcast over the whole block
+    values = df[present].to_numpy(dtype=np.float64)
+    mean = df[present].mean().to_numpy(dtype=np.float64)
+    std = df[present].std().to_numpy(dtype=np.float64)
+    # Scores are stored as float32, plenty for charting; constant (or single-value) columns score 0
+    scores = np.divide(values - mean, std, out=np.zeros(values.shape, dtype=np.float32), where=std > 0)
+    
+    z_columns = dict(zip(present, scores.T))
+    return pd.DataFrame({col: z_columns.get(col, df[col]) for col in df.columns},
+                        index=df.index, copy=True)
 
 def calculate_composite_score(data: pd.Series, weights: Dict[str, float]) -> float:
     """Calculate weighted composite score"""
-    score = 0
-    total_weight = 0
+    # reindex needs unique labels; a repeated metric is scored on its first value
+    if not data.index.is_unique:
+        data = data[~data.index.duplicated()]
     
-    for metric, weight in weights.items():
-        if metric in data.index and pd.notna(data[metric]):
-            score += data[metric] * weight
-            total_weight += weight
+    # Align values to the weight order once; missing and NaN metrics drop out of both sums
+    weight_vector = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+    values = data.reindex(list(weights)).to_numpy(dtype=np.float64)
+    present = ~np.isnan(values)
+    total_weight = weight_vector @ present
     
-    return score / total_weight if total_weight > 0 else 0
+    return float(np.where(present, values, 0.0) @ weight_vector / total_weight) if total_weight > 0 else 0
 
 def identify_outliers(data: pd.Series, threshold: float = 2.5) -> pd.Series:
     """Identify outliers using z-score method"""
     if len(data) < 3:
         return pd.Series(False, index=data.index)
     
-    z_scores = np.abs((data - data.mean()) / data.std())
-    return z_scores > threshold
+    # Compare distances to threshold * std directly: one subtraction, no z-score Series
+    values = data.to_numpy(dtype=np.float64)
+    return pd.Series(np.abs(values - data.mean()) > threshold * data.std(), index=data.index)
 
 def calculate_trend_coefficient(x: np.array, y: np.array) -> Tuple[float, float]:
     """Calculate trend line coefficients"""
@@ -85,15 +103,12 @@ def calculate_performance_index(player_metrics: pd.Series, team_metrics: pd.Seri
     if team_metrics.empty or player_metrics.empty:
         return 100.0
     
-    index_values = []
-    for metric in METRICS:
-        if metric in player_metrics.index and metric in team_metrics.index:
-            team_val = team_metrics[metric]
-            player_val = player_metrics[metric]
-            if team_val > 0:
-                index_values.append((player_val / team_val) * 100)
+    # Align both sides to METRICS once; metrics without a player value or a positive team value drop out
+    player_values = player_metrics.reindex(METRICS).to_numpy(dtype=np.float64)
+    team_values = team_metrics.reindex(METRICS).to_numpy(dtype=np.float64)
+    scored = (team_values > 0) & ~np.isnan(player_values)
     
-    return np.mean(index_values) if index_values else 100.0
+    return np.mean(player_values[scored] / team_values[scored] * 100) if scored.any() else 100.0
 
 def calculate_load_score_advanced(df: pd.DataFrame) -> pd.Series:
     """Calculate advanced load score with injury risk factors"""
@@ -106,32 +121,36 @@ def calculate_load_score_advanced(df: pd.DataFrame) -> pd.Series:
         "Max Speed": 0.05
     }
     
-    load_score = pd.Series(0, index=df.index)
+    cols = [metric for metric in base_weights if metric in df.columns]
+    weight_vector = np.fromiter((base_weights[metric] for metric in cols), dtype=np.float64, count=len(cols))
     
-    for metric, weight in base_weights.items():
-        if metric in df.columns:
-            # Normalize to 0-100 scale
-            normalized = (df[metric] - df[metric].min()) / (df[metric].max() - df[metric].min()) * 100
-            load_score += normalized * weight
+    # Normalize every column to a 0-100 scale in one block, then weight with a matrix-vector product
+    values = df[cols].to_numpy(dtype=np.float64)
+    col_min = df[cols].min().to_numpy(dtype=np.float64)
+    col_range = df[cols].max().to_numpy(dtype=np.float64) - col_min
+    with np.errstate(invalid='ignore', divide='ignore'):
+        normalized = (values - col_min) / col_range * 100
     
-    return load_score
+    return pd.Series(normalized @ weight_vector, index=df.index)
 
 def calculate_fatigue_index(current_load: float, historical_avg: float, 
                            historical_std: float) -> str:
     """Calculate fatigue index based on load deviation"""
+    return str(calculate_fatigue_index_vec(np.array([current_load]), historical_avg, historical_std)[0])
+
+def calculate_fatigue_index_vec(current_loads: np.ndarray, historical_avg: float, 
+                                historical_std: float) -> np.ndarray:
+    """Fatigue index for a whole array of loads against one baseline"""
+    current_loads = np.asarray(current_loads, dtype=np.float64)
     if historical_std == 0:
-        return "Normal"
-    
-    z_score = (current_load - historical_avg) / historical_std
-    
-    if z_score > 2:
-        return "High Risk"
-    elif z_score > 1:
-        return "Moderate Risk"
-    elif z_score < -1:
-        return "Under-loaded"
-    else:
-        return "Normal"
+        return np.full(current_loads.shape, "Normal")
+    
+    z_scores = (current_loads - historical_avg) / historical_std
+    return np.select(
+        [z_scores > 2, z_scores > 1, z_scores < -1],
+        ["High Risk", "Moderate Risk", "Under-loaded"],
+        default="Normal"
+    )
 
 def calculate_session_intensity(df: pd.DataFrame) -> pd.Series:
     """Calculate session intensity score"""
@@ -142,13 +161,11 @@ def calculate_session_intensity(df: pd.DataFrame) -> pd.Series:
         "No of Sprints": 0.2
     }
     
-    intensity_score = pd.Series(0, index=df.index)
-    
-    for metric, weight in intensity_metrics.items():
-        if metric in df.columns:
-            intensity_score += df[metric] * weight
+    cols = [metric for metric in intensity_metrics if metric in df.columns]
+    weight_vector = np.fromiter((intensity_metrics[metric] for metric in cols), dtype=np.float64, count=len(cols))
     
-    return intensity_score
+    # One matrix-vector product instead of a column-by-column accumulation
+    return pd.Series(df[cols].to_numpy(dtype=np.float64) @ weight_vector, index=df.index)
 
 def calculate_recovery_time(load_score: float, age: Optional[int] = None) -> int:
     """Estimate recovery time based on load score and age"""
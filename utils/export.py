@@ -1,11 +1,13 @@
 """Export and report generation utilities"""
 import pandas as pd
+import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
 import base64
 from io import BytesIO
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 from core.theme import ThemeConfig
 
@@ -15,36 +17,68 @@ def generate_pdf_report(data: Dict, filename: str) -> bytes:
     # For now, returning a placeholder
     return b"PDF Report Content"
 
+# Text written for infinite values in Excel exports, matching DataFrame.to_excel's default inf_rep
+INF_REP = 'inf'
+
 def export_to_excel(dataframes: Dict[str, pd.DataFrame], filename: str) -> bytes:
     """Export multiple dataframes to Excel with formatting"""
     output = BytesIO()
     
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+    # constant_memory streams each finished row to disk instead of holding every cell until close;
+    # rows must then be written strictly top-down, so cells are written here rather than by to_excel
+    engine_kwargs = {'options': {'constant_memory': True,
+                                 'default_date_format': 'yyyy-mm-dd hh:mm:ss'}}
+    
+    with pd.ExcelWriter(output, engine='xlsxwriter', engine_kwargs=engine_kwargs) as writer:
+        workbook = writer.book
+        
+        # Add formatting
+        header_format = workbook.add_format({
+            'bold': True,
+            'text_wrap': True,
+            'valign': 'top',
+            'fg_color': '#D72638',
+            'font_color': '#FFFFFF',
+            'border': 1
+        })
+        
         for sheet_name, df in dataframes.items():
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
+            worksheet = workbook.add_worksheet(sheet_name)
             
-            # Get workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets[sheet_name]
+            # Auto-adjust column widths from vectorized string lengths; column settings
+            # are not row data, so they can be set before any row is written
+            cell_widths = np.array([df[col].astype(str).str.len().max() if len(df) else 0
+                                    for col in df.columns], dtype=np.int64)
+            header_widths = np.fromiter((len(col) for col in df.columns), dtype=np.int64, count=len(df.columns))
+            for idx, width in enumerate(np.maximum(cell_widths, header_widths) + 2):
+                worksheet.set_column(idx, idx, int(width))
             
-            # Add formatting
-            header_format = workbook.add_format({
-                'bold': True,
-                'text_wrap': True,
-                'valign': 'top',
-                'fg_color': '#D72638',
-                'font_color': '#FFFFFF',
-                'border': 1
-            })
-            
-            # Write headers with formatting
-            for col_num, value in enumerate(df.columns.values):
-                worksheet.write(0, col_num, value, header_format)
-            
-            # Auto-adjust column widths
-            for idx, col in enumerate(df.columns):
-                max_len = max(df[col].astype(str).map(len).max(), len(col)) + 2
-                worksheet.set_column(idx, idx, max_len)
+            # Write headers with formatting, then stream rows straight from the column arrays;
+            # missing values are left as blank cells and infinities are written as text, as
+            # to_excel's inf_rep does (xlsxwriter rejects them)
+            worksheet.write_row(0, 0, df.columns.tolist(), header_format)
+            columns = []
+            for _, series in df.items():
+                if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+                    # NumPy numeric buffers are used as they are; nullable extension columns become float64
+                    if isinstance(series.dtype, np.dtype):
+                        values = series.to_numpy()
+                    else:
+                        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                else:
+                    values = series.to_numpy(dtype=object)
+                infinite = np.isinf(values) if values.dtype.kind == 'f' else None
+                columns.append((values, series.isna().to_numpy(),
+                                infinite if infinite is not None and infinite.any() else None))
+            for row_num in range(len(df)):
+                for col_num, (values, missing, infinite) in enumerate(columns):
+                    if missing[row_num]:
+                        continue
+                    value = values[row_num]
+                    if infinite is not None and infinite[row_num]:
+                        worksheet.write_string(row_num + 1, col_num, INF_REP if value > 0 else f"-{INF_REP}")
+                    else:
+                        worksheet.write(row_num + 1, col_num, value)
     
     return output.getvalue()
 
@@ -184,19 +218,34 @@ def export_to_json(data: Dict, filename: str) -> str:
     
     return json.dumps(serializable_data, indent=2, default=str)
 
+# PNG resolution for exported charts; 150 dpi is sharp in reports at a quarter of 300 dpi's pixels
+EXPORT_DPI = 150
+
+def _figure_to_base64(fig: Figure) -> str:
+    """Rasterize a figure into a PNG data URI"""
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=EXPORT_DPI, 
+                facecolor=ThemeConfig.BACKGROUND_COLOR)
+    # Encode straight from the buffer's memory and decode the finished URI once
+    return (b"data:image/png;base64," + base64.b64encode(buffer.getbuffer())).decode('ascii')
+
 def create_comparison_chart(data: pd.DataFrame, player_names: List[str], 
                            metric: str, output_format: str = 'base64') -> str:
     """Create comparison chart for export"""
     plt.style.use('dark_background')
-    fig, ax = plt.subplots(figsize=(10, 6))
+    # Plain Figure objects skip pyplot's global figure registry and need no plt.close()
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
     
     # Filter data for selected players
     chart_data = data[data['Player Name'].isin(player_names)]
     
     # Create bar chart
     x_pos = range(len(player_names))
-    values = [chart_data[chart_data['Player Name'] == p][metric].mean() 
-              for p in player_names]
+    # One grouped pass for every player's mean, in the requested player order
+    values = (chart_data.groupby('Player Name', observed=True, sort=False)[metric].mean()
+              .reindex(player_names)
+              .to_numpy())
     
     bars = ax.bar(x_pos, values, color=ThemeConfig.PRIMARY_COLOR)
     
@@ -217,37 +266,28 @@ def create_comparison_chart(data: pd.DataFrame, player_names: List[str],
     ax.set_facecolor(ThemeConfig.CARD_BACKGROUND)
     fig.patch.set_facecolor(ThemeConfig.BACKGROUND_COLOR)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     if output_format == 'base64':
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=300, 
-                   facecolor=ThemeConfig.BACKGROUND_COLOR)
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
-        return f"data:image/png;base64,{image_base64}"
+        return _figure_to_base64(fig)
     else:
         return fig
 
 def generate_csv_export(df: pd.DataFrame, filename: str) -> str:
     """Generate CSV export with proper formatting"""
-    # Round numeric columns
-    numeric_columns = df.select_dtypes(include=[np.number]).columns
-    df_export = df.copy()
-    df_export[numeric_columns] = df_export[numeric_columns].round(2)
-    
-    return df_export.to_csv(index=False)
+    # Round floats to two decimals while serializing, so no rounded copy of the frame is built
+    return df.to_csv(index=False, float_format='%.2f')
 
 def create_session_summary_table(sessions_data: pd.DataFrame) -> str:
     """Create formatted session summary table"""
-    summary = sessions_data.groupby(['Session Type', 'Data Source']).agg({
+    summary = sessions_data.groupby(['Session Type', 'Data Source'], observed=True).agg({
         'Total Distance': ['mean', 'std'],
         'Max Speed': ['mean', 'max'],
         'No of Sprints': ['mean', 'sum']
-    }).round(2)
+    })
     
-    return summary.to_html(classes='summary-table')
+    # Two-decimal formatting happens while rendering, without a rounded copy of the summary
+    return summary.to_html(classes='summary-table', float_format='%.2f')
 
 def export_player_card(player_data: Dict) -> str:
     """Create player card for export/sharing"""
@@ -291,8 +331,8 @@ def export_player_card(player_data: Dict) -> str:
 def create_training_load_chart(load_data: pd.DataFrame, player_name: str) -> str:
     """Create training load progression chart"""
     plt.style.use('dark_background')
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), 
-                                   gridspec_kw={'height_ratios': [3, 1]})
+    fig = Figure(figsize=(12, 8))
+    ax1, ax2 = fig.subplots(2, 1, gridspec_kw={'height_ratios': [3, 1]})
     
     # Main load chart
     sessions = range(len(load_data))
@@ -331,16 +371,9 @@ def create_training_load_chart(load_data: pd.DataFrame, player_name: str) -> str
         ax.set_facecolor(ThemeConfig.CARD_BACKGROUND)
     fig.patch.set_facecolor(ThemeConfig.BACKGROUND_COLOR)
     
-    plt.tight_layout()
-    
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, 
-               facecolor=ThemeConfig.BACKGROUND_COLOR)
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.getvalue()).decode()
-    plt.close()
+    fig.tight_layout()
     
-    return f"data:image/png;base64,{image_base64}"
+    return _figure_to_base64(fig)
 
 def export_team_report(team_data: Dict, format: str = 'html') -> str:
     """Export comprehensive team report"""
@@ -442,18 +475,38 @@ def export_team_report(team_data: Dict, format: str = 'html') -> str:
     else:
         return "Format not supported"
 
+# Backups are a 4-byte big-endian header length, a JSON header, then the data as Parquet
+BACKUP_HEADER_LENGTH_BYTES = 4
+
 def create_backup_data(all_data: pd.DataFrame, metadata: Dict) -> bytes:
     """Create backup of all data with metadata"""
-    backup = {
+    header = {
         'metadata': {
             'created': datetime.now().isoformat(),
-            'version': '1.0',
+            'version': '2.0',
             'team': metadata.get('team', 'Unknown'),
             'total_records': len(all_data)
         },
-        'data': all_data.to_dict(orient='records'),
+        'format': 'parquet',
         'columns': list(all_data.columns),
         'dtypes': {col: str(dtype) for col, dtype in all_data.dtypes.items()}
     }
+    header_bytes = json.dumps(header, default=str).encode('utf-8')
+    
+    # Arrow rejects object columns mixing types (e.g. IDs stored as numbers and text), so they are
+    # stringified like the JSON format's default=str did; missing values stay missing
+    object_columns = all_data.select_dtypes(include=['object']).columns
+    parquet_data = all_data.astype({col: 'string' for col in object_columns}) if len(object_columns) else all_data
     
-    return json.dumps(backup, indent=2, default=str).encode('utf-8')
+    # Columnar, compressed payload written straight from the column buffers
+    data = BytesIO()
+    parquet_data.to_parquet(data, engine='pyarrow', compression='zstd', index=False)
+    
+    return (len(header_bytes).to_bytes(BACKUP_HEADER_LENGTH_BYTES, 'big')
+            + header_bytes + data.getvalue())
+
+def read_backup_data(backup: bytes) -> Tuple[Dict, pd.DataFrame]:
+    """Split a backup from create_backup_data into its header and data frame"""
+    header_end = BACKUP_HEADER_LENGTH_BYTES + int.from_bytes(backup[:BACKUP_HEADER_LENGTH_BYTES], 'big')
+    header = json.loads(backup[BACKUP_HEADER_LENGTH_BYTES:header_end])
+    return header, pd.read_parquet(BytesIO(backup[header_end:]), engine='pyarrow')